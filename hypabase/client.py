@@ -268,15 +268,7 @@ class Hypabase:
         """
         if not id:
             raise ValueError("Node ID must be a non-empty string")
-        existing = self._store.get_node(id)
-        if existing:
-            existing.type = type
-            if properties:
-                existing.properties.update(properties)
-        else:
-            self._store.add_node(CoreNode(id=id, type=type, properties=properties))
-        core_node = self._store.get_node(id)
-        assert core_node is not None, f"Node {id!r} should exist after add_node"
+        core_node = self._store.upsert_node(CoreNode(id=id, type=type, properties=properties))
         self._auto_save()
         return _core_node_to_model(core_node)
 
@@ -501,12 +493,14 @@ class Hypabase:
             )
         elif type:
             core_edges = self._store.get_edges_by_type(type)
+        elif source is not None:
+            core_edges = self._store.get_edges_by_source(source)
         else:
             core_edges = self._store.get_all_edges()
 
         if type and containing:
             core_edges = [e for e in core_edges if e.type == type]
-        if source is not None:
+        if source is not None and (containing or type):
             core_edges = [e for e in core_edges if e.source == source]
         if min_confidence is not None:
             core_edges = [e for e in core_edges if e.confidence >= min_confidence]
@@ -553,17 +547,13 @@ class Hypabase:
             # [{"source": "clinical_records", "edge_count": 2, "avg_confidence": 0.95}]
             ```
         """
-        all_edges = self._store.get_all_edges()
-        source_data: dict[str, list[float]] = {}
-        for e in all_edges:
-            source_data.setdefault(e.source, []).append(e.confidence)
         return [
             {
                 "source": src,
-                "edge_count": len(confs),
-                "avg_confidence": round(sum(confs) / len(confs), 4),
+                "edge_count": count,
+                "avg_confidence": round(avg_confidence, 4),
             }
-            for src, confs in sorted(source_data.items())
+            for src, (count, avg_confidence) in sorted(self._store.source_stats().items())
         ]
 
     def edges_by_vertex_set(self, nodes: list[str]) -> list[Edge]:
@@ -650,26 +640,38 @@ class Hypabase:
         if start == end:
             return [[start]]
 
-        visited: set[str] = {start}
-        queue: deque[list[str]] = deque([[start]])
+        # An end node on no (matching) edge is unreachable; skip the search
+        if self._store.node_degree(end, edge_types=edge_types or None) == 0:
+            return []
+
+        # BFS over node IDs. Each visited node records the node it was reached
+        # from, so a path is rebuilt only when ``end`` is hit instead of
+        # copying the partial path on every enqueue.
+        parents: dict[str, str | None] = {start: None}
+        queue: deque[tuple[str, int]] = deque([(start, 0)])
         results: list[list[str]] = []
 
         while queue:
-            path = queue.popleft()
-            if len(path) - 1 >= max_hops:
+            current, hops = queue.popleft()
+            if hops >= max_hops:
                 continue
 
-            current = path[-1]
             for nid in self._store.get_neighbor_nodes(
                 current,
                 edge_types=edge_types,
                 exclude_self=True,
             ):
                 if nid == end:
-                    results.append([*path, end])
-                elif nid not in visited:
-                    visited.add(nid)
-                    queue.append([*path, nid])
+                    path = [end]
+                    node: str | None = current
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    path.reverse()
+                    results.append(path)
+                elif nid not in parents:
+                    parents[nid] = current
+                    queue.append((nid, hops + 1))
 
         return results
 
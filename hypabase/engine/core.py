@@ -21,19 +21,139 @@ References:
 - Stewart & Buehler: Intersection-constrained path finding (2026)
 """
 
+import json
+import math
+import sys
 import threading
 import uuid
-from collections import defaultdict, deque
-from collections.abc import Callable, Generator
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Callable, Collection, Generator, Iterable, Sequence
+from collections.abc import Set as AbstractSet
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypeVar
 
+try:
+    import orjson
 
-@dataclass
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
+
+# Shared empty posting list for index misses
+_EMPTY_IDS: frozenset[str] = frozenset()
+
+# Incidence directions in slot order, and the slot each accepted value maps to.
+# Hyperedge sorts participants into per-direction buckets by slot index.
+_DIRECTIONS: tuple[str | None, ...] = (None, "head", "tail")
+_DIRECTION_SLOTS: dict[str | None, int] = {d: i for i, d in enumerate(_DIRECTIONS)}
+
+# Maximum number of memoized find_paths() results kept per store
+PATH_CACHE_SIZE = 128
+
+_K = TypeVar("_K")
+
+
+def _intern(value: str) -> str:
+    """Intern an identifier string; str subclasses cannot be interned and pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _is_plain_json(data: Any) -> bool:
+    """Check whether data holds only values orjson encodes exactly as stdlib json does.
+
+    That is dicts, lists, tuples, str, int, bool, None and finite floats at
+    any depth. orjson also writes datetime, UUID, dataclass and Enum values
+    that the stdlib encoder rejects, and writes NaN/Infinity as null.
+    """
+    stack = [data]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        value = pop()
+        value_type = type(value)
+        if value_type is str or value_type is int or value_type is bool or value is None:
+            continue
+        if value_type is dict:
+            extend(value.values())
+        elif value_type is list or value_type is tuple:
+            extend(value)
+        elif value_type is float:
+            if not math.isfinite(value):
+                return False
+        else:
+            return False
+    return True
+
+
+def _dumps_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, preferring orjson when available.
+
+    The output always matches what the stdlib encoder would write, and
+    anything the stdlib encoder rejects still raises TypeError. orjson only
+    sees plain JSON values (see _is_plain_json()); it rejects integers
+    beyond 64 bits and non-string keys, and data holding either is encoded
+    with the stdlib json module instead.
+    """
+    if _HAS_ORJSON and _is_plain_json(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            pass  # Out-of-range integers or non-string keys
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_json(data: bytes | str) -> Any:
+    """Parse JSON text or UTF-8 bytes, preferring orjson when available.
+
+    Falls back to the stdlib parser for input orjson rejects. That includes
+    the NaN/Infinity literals _dumps_json() writes for non-finite floats, so
+    saved files read back exactly with or without orjson installed.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _discard_posting(index: dict[_K, set[str]], key: _K, record_id: str) -> None:
+    """Remove an ID from a posting list, dropping the key once its list is empty.
+
+    Uses .get() so a missing key is never materialized by a defaultdict index.
+    """
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(record_id)
+        if not ids:
+            del index[key]
+
+
+def _discard_ordered_posting(index: dict[_K, dict[str, None]], key: _K, record_id: str) -> None:
+    """Remove an ID from an insertion-ordered posting list, as _discard_posting() does."""
+    ids = index.get(key)
+    if ids is not None:
+        ids.pop(record_id, None)
+        if not ids:
+            del index[key]
+
+
+def _copy_index(index: dict[_K, set[str]]) -> dict[_K, set[str]]:
+    """Copy a posting-list index, giving each key its own set."""
+    copied: dict[_K, set[str]] = defaultdict(set)
+    for key, ids in index.items():
+        copied[key] = set(ids)
+    return copied
+
+
+@dataclass(slots=True, frozen=True)
 class Node:
     """An entity in the hypergraph.
 
+    Instances are immutable; use HypergraphCore.upsert_node() to change a
+    stored node's type or properties.
+
     Attributes:
         id: Unique identifier for the node
         type: Extensible type string (e.g., "table", "column", "concept")
@@ -52,10 +172,36 @@ class Node:
             raise TypeError(f"Node id must be a string, got: {type(self.id).__name__}")
         if not isinstance(self.type, str):
             raise TypeError(f"Node type must be a string, got: {type(self.type).__name__}")
+        # Intern identifiers so the copies held by incidences and indexes
+        # share one object and dict lookups hit the identity fast path
+        object.__setattr__(self, "id", _intern(self.id))
+        object.__setattr__(self, "type", _intern(self.type))
+
+    def __hash__(self) -> int:
+        # Equal nodes share an id, and str caches its own hash
+        return hash(self.id)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle only the constructor arguments; __post_init__ re-interns
+        # the strings in the loading process
+        return (type(self), (self.id, self.type, self.properties))
+
+
+class _IncidenceViews:
+    """Slot for the direction index Incidence derives in __post_init__.
+
+    A plain base-class slot, not a dataclass field, so it never shows up in
+    dataclasses.fields() or asdict().
+    """
+
+    __slots__ = ("_direction_slot",)
+
+    # Index of direction in _DIRECTIONS
+    _direction_slot: int
 
 
-@dataclass
-class Incidence:
+@dataclass(slots=True, frozen=True)
+class Incidence(_IncidenceViews):
     """A node's or edge's participation in a hyperedge, with optional direction.
 
     Follows HIF standard where direction is specified per-incidence, not per-edge.
@@ -87,35 +233,90 @@ class Incidence:
     properties: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        if self.node_id is None and self.edge_ref_id is None:
+        # Dispatch once on which reference is set; each branch then runs only
+        # the checks that apply to it
+        node_id = self.node_id
+        edge_ref_id = self.edge_ref_id
+        if node_id is not None:
+            if edge_ref_id is not None:
+                raise ValueError("Incidence cannot have both node_id and edge_ref_id")
+            if not isinstance(node_id, str):
+                raise TypeError(
+                    f"Incidence node_id must be a string, got: {type(node_id).__name__}"
+                )
+        elif edge_ref_id is not None:
+            if not isinstance(edge_ref_id, str):
+                raise TypeError(
+                    f"Incidence edge_ref_id must be a string, got: {type(edge_ref_id).__name__}"
+                )
+        else:
             raise ValueError("Incidence must have either node_id or edge_ref_id")
-        if self.node_id is not None and self.edge_ref_id is not None:
-            raise ValueError("Incidence cannot have both node_id and edge_ref_id")
-        if self.node_id is not None and not isinstance(self.node_id, str):
-            raise TypeError(
-                f"Incidence node_id must be a string, got: {type(self.node_id).__name__}"
-            )
-        if self.edge_ref_id is not None and not isinstance(self.edge_ref_id, str):
-            raise TypeError(
-                f"Incidence edge_ref_id must be a string, got: {type(self.edge_ref_id).__name__}"
-            )
-        if self.direction is not None and self.direction not in ("head", "tail"):
+        try:
+            slot = _DIRECTION_SLOTS[self.direction]
+        except (KeyError, TypeError):
             raise ValueError(
                 f"Incidence direction must be None, 'head', or 'tail', got: {self.direction!r}"
-            )
+            ) from None
+        # Store the canonical direction string so every incidence shares it
+        object.__setattr__(self, "direction", _DIRECTIONS[slot])
+        object.__setattr__(self, "_direction_slot", slot)
+        if node_id is not None:
+            object.__setattr__(self, "node_id", _intern(node_id))
+        elif edge_ref_id is not None:
+            object.__setattr__(self, "edge_ref_id", _intern(edge_ref_id))
+
+    def __hash__(self) -> int:
+        # Not cached: str hashes are salted per process, so a stored value
+        # would go stale once a pickled store is loaded elsewhere
+        return hash((self.node_id, self.edge_ref_id, self.direction))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (self.node_id, self.edge_ref_id, self.direction, self.properties))
 
 
-@dataclass
-class Hyperedge:
+class _HyperedgeViews:
+    """Slots for the incidence views Hyperedge derives in __post_init__.
+
+    Declared on a plain base class rather than as dataclass fields, so they
+    stay out of dataclasses.fields(), asdict(), repr() and comparisons.
+    """
+
+    __slots__ = (
+        "_nodes",
+        "_node_set",
+        "_edge_refs",
+        "_head_nodes",
+        "_tail_nodes",
+        "_is_directed",
+        "_head_set",
+        "_tail_set",
+    )
+
+    _nodes: tuple[str, ...]
+    _node_set: frozenset[str]
+    _edge_refs: tuple[str, ...]
+    _head_nodes: tuple[str, ...]
+    _tail_nodes: tuple[str, ...]
+    _is_directed: bool
+    # Node sets matched by directed traversal: the head (or tail) nodes, or
+    # every node when the edge has none in that role
+    _head_set: frozenset[str]
+    _tail_set: frozenset[str]
+
+
+@dataclass(slots=True, frozen=True)
+class Hyperedge(_HyperedgeViews):
     """An n-ary relationship between nodes and/or other edges.
 
     Uses incidence-based representation for HIF compatibility.
-    Supports both directed and undirected hyperedges.
+    Supports both directed and undirected hyperedges. Instances are
+    immutable; use HypergraphCore.upsert_edge() to replace a stored edge.
 
     Attributes:
         id: Unique identifier for the edge
         type: Extensible type string (e.g., "foreign_key", "concept_mapping")
-        incidences: List of node or edge-ref participations with optional directions
+        incidences: Node or edge-ref participations with optional directions,
+            stored as a tuple
         properties: Arbitrary key-value metadata
         source: Provenance - where this edge came from
         confidence: Quality score from 0.0 to 1.0
@@ -127,7 +328,7 @@ class Hyperedge:
 
     id: str
     type: str
-    incidences: list[Incidence]
+    incidences: Sequence[Incidence]
     properties: dict[str, Any] = field(default_factory=dict)
     source: str = "unknown"
     confidence: float = 1.0
@@ -137,48 +338,89 @@ class Hyperedge:
             raise TypeError(f"Hyperedge id must be a string, got: {type(self.id).__name__}")
         if not isinstance(self.type, str):
             raise TypeError(f"Hyperedge type must be a string, got: {type(self.type).__name__}")
+        object.__setattr__(self, "id", _intern(self.id))
+        object.__setattr__(self, "type", _intern(self.type))
+        # Provenance labels repeat across most edges in a store
+        object.__setattr__(self, "source", _intern(self.source))
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError(
                 f"Hyperedge confidence must be between 0.0 and 1.0, got: {self.confidence}"
             )
+        # Freeze incidences so the derived views below cannot go stale
+        object.__setattr__(self, "incidences", tuple(self.incidences))
+        # Single pass over incidences to build every derived view
+        nodes: list[str] = []
+        edge_refs: list[str] = []
+        # Node IDs bucketed by direction slot: undirected, head, tail
+        by_direction: tuple[list[str], list[str], list[str]] = ([], [], [])
+        directed_refs = False
+        for inc in self.incidences:
+            node_id = inc.node_id
+            if node_id is not None:
+                nodes.append(node_id)
+                by_direction[inc._direction_slot].append(node_id)
+            elif inc.edge_ref_id is not None:
+                edge_refs.append(inc.edge_ref_id)
+                directed_refs = directed_refs or inc.direction is not None
+        _, head_nodes, tail_nodes = by_direction
+        is_directed = bool(head_nodes or tail_nodes) or directed_refs
+        object.__setattr__(self, "_nodes", tuple(nodes))
+        # Edge-ref-only edges share one empty set instead of allocating their own
+        object.__setattr__(self, "_node_set", frozenset(nodes) if nodes else _EMPTY_IDS)
+        object.__setattr__(self, "_edge_refs", tuple(edge_refs))
+        object.__setattr__(self, "_head_nodes", tuple(head_nodes))
+        object.__setattr__(self, "_tail_nodes", tuple(tail_nodes))
+        object.__setattr__(self, "_is_directed", is_directed)
+        node_set = self._node_set
+        object.__setattr__(self, "_head_set", frozenset(head_nodes) if head_nodes else node_set)
+        object.__setattr__(self, "_tail_set", frozenset(tail_nodes) if tail_nodes else node_set)
 
     @property
     def nodes(self) -> list[str]:
         """All participating node IDs (for intersection calculations)."""
-        return [inc.node_id for inc in self.incidences if inc.node_id is not None]
+        return list(self._nodes)
 
     @property
-    def node_set(self) -> set[str]:
+    def node_set(self) -> frozenset[str]:
         """All participating node IDs as a set."""
-        return {inc.node_id for inc in self.incidences if inc.node_id is not None}
+        return self._node_set
 
     @property
     def edge_refs(self) -> list[str]:
         """All referenced edge IDs (for metagraph traversal)."""
-        return [inc.edge_ref_id for inc in self.incidences if inc.edge_ref_id is not None]
+        return list(self._edge_refs)
 
     @property
     def head_nodes(self) -> list[str]:
         """Node IDs marked as head/receivers/targets."""
-        return [
-            inc.node_id
-            for inc in self.incidences
-            if inc.direction == "head" and inc.node_id is not None
-        ]
+        return list(self._head_nodes)
 
     @property
     def tail_nodes(self) -> list[str]:
         """Node IDs marked as tail/senders/sources."""
-        return [
-            inc.node_id
-            for inc in self.incidences
-            if inc.direction == "tail" and inc.node_id is not None
-        ]
+        return list(self._tail_nodes)
 
     @property
     def is_directed(self) -> bool:
         """True if any incidence has a direction."""
-        return any(inc.direction is not None for inc in self.incidences)
+        return self._is_directed
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Derived incidence views are rebuilt on load rather than pickled
+        return (
+            type(self),
+            (
+                self.id,
+                self.type,
+                self.incidences,
+                self.properties,
+                self.source,
+                self.confidence,
+            ),
+        )
 
 
 class HypergraphCore:
@@ -202,49 +444,109 @@ class HypergraphCore:
         self._node_to_edges: dict[str, set[str]] = defaultdict(set)
         self._nodes_by_type: dict[str, set[str]] = defaultdict(set)
         self._edges_by_type: dict[str, set[str]] = defaultdict(set)
+        # Provenance index: source -> edge IDs, kept in insertion order (dict
+        # keys) so get_edges_by_source() lists edges in the order they were added
+        self._edges_by_source: dict[str, dict[str, None]] = defaultdict(dict)
         # Vertex-set index for O(1) Cog-RAG style lookup
         # Maps frozenset of node IDs -> set of edge IDs (multiple edges can share same node set)
         self._edges_by_node_set: dict[frozenset[str], set[str]] = defaultdict(set)
         # Metagraph index: maps referenced edge ID -> set of edge IDs that reference it
         self._edge_to_edges: dict[str, set[str]] = defaultdict(set)
+        # LRU memo of find_paths() results, cleared whenever the edge set changes
+        self._path_cache: OrderedDict[tuple, tuple[tuple[Hyperedge, ...], ...]] = OrderedDict()
         # Reentrant lock for thread safety (reentrant because delete_node_cascade
         # calls delete_node and delete_edge internally)
         self._lock = threading.RLock()
 
     def __getstate__(self) -> dict[str, Any]:
-        """Support for pickle/deepcopy - exclude the lock."""
+        """Support for pickle/deepcopy - exclude the lock and path cache."""
         state = self.__dict__.copy()
         del state["_lock"]
+        state.pop("_path_cache", None)
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
-        """Support for pickle/deepcopy - recreate the lock."""
+        """Support for pickle/deepcopy - recreate the lock and path cache."""
         self.__dict__.update(state)
+        self._path_cache = OrderedDict()
         self._lock = threading.RLock()
 
     def __deepcopy__(self, memo: dict) -> "HypergraphCore":
         """Support for copy.deepcopy - create new instance with copied data.
 
+        Records are immutable apart from their property dicts, so every Node,
+        Incidence and Hyperedge is rebuilt around a deep copy of its own
+        properties, even an empty one; only IDs and other immutable values are
+        shared with the original. Indexes hold only ID strings and are copied
+        per set, as in clone().
+
         Thread-safe: acquires lock during copy to prevent concurrent modifications.
         """
         import copy
 
         with self._lock:
-            new_store = HypergraphCore.__new__(HypergraphCore)
+            new_store = self.clone()
             memo[id(self)] = new_store
 
-            # Deep copy all state except the lock
-            new_store._nodes = copy.deepcopy(self._nodes, memo)
-            new_store._edges = copy.deepcopy(self._edges, memo)
-            new_store._node_to_edges = copy.deepcopy(self._node_to_edges, memo)
-            new_store._nodes_by_type = copy.deepcopy(self._nodes_by_type, memo)
-            new_store._edges_by_type = copy.deepcopy(self._edges_by_type, memo)
-            new_store._edges_by_node_set = copy.deepcopy(self._edges_by_node_set, memo)
-            new_store._edge_to_edges = copy.deepcopy(self._edge_to_edges, memo)
+            nodes = new_store._nodes
+            for node_id, node in nodes.items():
+                nodes[node_id] = Node(
+                    id=node.id,
+                    type=node.type,
+                    properties=copy.deepcopy(node.properties, memo),
+                )
 
-            # Create a new lock for the copy
-            new_store._lock = threading.RLock()
+            edges = new_store._edges
+            for edge_id, edge in edges.items():
+                edges[edge_id] = Hyperedge(
+                    id=edge.id,
+                    type=edge.type,
+                    incidences=[
+                        Incidence(
+                            node_id=inc.node_id,
+                            edge_ref_id=inc.edge_ref_id,
+                            direction=inc.direction,
+                            properties=copy.deepcopy(inc.properties, memo),
+                        )
+                        for inc in edge.incidences
+                    ],
+                    properties=copy.deepcopy(edge.properties, memo),
+                    source=edge.source,
+                    confidence=edge.confidence,
+                )
+
+            # Memoized paths hold the original edge objects
+            new_store._invalidate_path_cache()
+            return new_store
+
+    def clone(self) -> "HypergraphCore":
+        """Return an independent copy of this store without deep-copying records.
+
+        Node and Hyperedge records are immutable, so the clone shares them and
+        only rebuilds the container dicts and index sets. Adding, replacing or
+        deleting nodes and edges on either store never affects the other.
+        Property dicts are shared with the original; use copy.deepcopy() when
+        property values themselves will be mutated in place.
 
+        Thread-safe: acquires lock during copy to prevent concurrent modifications.
+
+        Returns:
+            A new HypergraphCore with the same nodes, edges and indexes
+        """
+        with self._lock:
+            new_store = HypergraphCore()
+            new_store._nodes = dict(self._nodes)
+            new_store._edges = dict(self._edges)
+            new_store._node_to_edges = _copy_index(self._node_to_edges)
+            new_store._nodes_by_type = _copy_index(self._nodes_by_type)
+            new_store._edges_by_type = _copy_index(self._edges_by_type)
+            new_store._edges_by_source = defaultdict(dict)
+            for source, source_ids in self._edges_by_source.items():
+                new_store._edges_by_source[source] = dict(source_ids)
+            new_store._edges_by_node_set = _copy_index(self._edges_by_node_set)
+            new_store._edge_to_edges = _copy_index(self._edge_to_edges)
+            # Memoized paths describe the current edge set, which the clone shares
+            new_store._path_cache = OrderedDict(self._path_cache)
             return new_store
 
     # ========== Thread Safety ==========
@@ -272,6 +574,88 @@ class HypergraphCore:
         with self._lock:
             yield
 
+    def _invalidate_path_cache(self) -> None:
+        """Drop memoized paths after an edge mutation.
+
+        Note: This method assumes the caller holds the lock.
+        """
+        self._path_cache.clear()
+
+    # ========== Bulk Loading ==========
+
+    def bulk_add(
+        self,
+        nodes: Iterable[Node] = (),
+        edges: Iterable[Hyperedge] = (),
+    ) -> None:
+        """Add many nodes and edges, rebuilding the indexes once at the end.
+
+        Equivalent to calling add_node() for each node and then add_edge()
+        for each edge, but records go straight into the node and edge tables
+        and every index is rebuilt in a single pass afterwards instead of
+        being updated per record. Prefer this for loading large graphs.
+
+        Args:
+            nodes: Nodes to add; later duplicates overwrite earlier ones
+            edges: Hyperedges to add; later duplicates overwrite earlier ones
+        """
+        with self._lock:
+            try:
+                node_table = self._nodes
+                for node in nodes:
+                    node_table[node.id] = node
+                edge_table = self._edges
+                for edge in edges:
+                    edge_table[edge.id] = edge
+            finally:
+                # Keep indexes consistent with whatever was inserted, even if
+                # the iterables raised partway through
+                self._rebuild_indexes()
+
+    @classmethod
+    def from_iter(
+        cls,
+        nodes: Iterable[Node] = (),
+        edges: Iterable[Hyperedge] = (),
+    ) -> "HypergraphCore":
+        """Create a store from nodes and edges via bulk_add()."""
+        store = cls()
+        store.bulk_add(nodes, edges)
+        return store
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild every index from the node and edge tables.
+
+        Note: This method assumes the caller holds the lock.
+        """
+        nodes_by_type: dict[str, set[str]] = defaultdict(set)
+        for node_id, node in self._nodes.items():
+            nodes_by_type[node.type].add(node_id)
+
+        edges_by_type: dict[str, set[str]] = defaultdict(set)
+        edges_by_source: dict[str, dict[str, None]] = defaultdict(dict)
+        node_to_edges: dict[str, set[str]] = defaultdict(set)
+        edges_by_node_set: dict[frozenset[str], set[str]] = defaultdict(set)
+        edge_to_edges: dict[str, set[str]] = defaultdict(set)
+        for edge_id, edge in self._edges.items():
+            edges_by_type[edge.type].add(edge_id)
+            edges_by_source[edge.source][edge_id] = None
+            node_set = edge.node_set
+            for node_id in node_set:
+                node_to_edges[node_id].add(edge_id)
+            for ref_id in edge._edge_refs:
+                edge_to_edges[ref_id].add(edge_id)
+            if node_set:
+                edges_by_node_set[node_set].add(edge_id)
+
+        self._nodes_by_type = nodes_by_type
+        self._edges_by_type = edges_by_type
+        self._edges_by_source = edges_by_source
+        self._node_to_edges = node_to_edges
+        self._edges_by_node_set = edges_by_node_set
+        self._edge_to_edges = edge_to_edges
+        self._invalidate_path_cache()
+
     # ========== Node Operations ==========
 
     def add_node(self, node: Node) -> None:
@@ -282,12 +666,11 @@ class HypergraphCore:
         """
         with self._lock:
             existing = self._nodes.get(node.id)
-            if existing is not None:
-                # Always clean up old type index for consistency with add_edge behavior
-                self._nodes_by_type[existing.type].discard(node.id)
-                if not self._nodes_by_type[existing.type]:
-                    del self._nodes_by_type[existing.type]
             self._nodes[node.id] = node
+            if existing is not None:
+                if existing.type == node.type:
+                    return  # Type bucket already holds this ID
+                _discard_posting(self._nodes_by_type, existing.type, node.id)
             self._nodes_by_type[node.type].add(node.id)
 
     def get_node(self, node_id: str) -> Node | None:
@@ -298,7 +681,7 @@ class HypergraphCore:
     def get_nodes_by_type(self, node_type: str) -> list[Node]:
         """Get all nodes of a specific type."""
         with self._lock:
-            return [self._nodes[nid] for nid in self._nodes_by_type.get(node_type, set())]
+            return [self._nodes[nid] for nid in self._nodes_by_type.get(node_type, _EMPTY_IDS)]
 
     def find_nodes(self, **properties: Any) -> list[Node]:
         """Find nodes matching all specified properties."""
@@ -327,10 +710,8 @@ class HypergraphCore:
             if node_id not in self._nodes:
                 return False
             node = self._nodes[node_id]
-            self._nodes_by_type[node.type].discard(node_id)
             # Clean up empty type sets to prevent memory leaks
-            if not self._nodes_by_type[node.type]:
-                del self._nodes_by_type[node.type]
+            _discard_posting(self._nodes_by_type, node.type, node_id)
             del self._nodes[node_id]
             return True
 
@@ -351,7 +732,7 @@ class HypergraphCore:
                 return (False, 0)
 
             # Get all incident edge IDs before deletion
-            edge_ids = list(self._node_to_edges.get(node_id, set()))
+            edge_ids = list(self._node_to_edges.get(node_id, _EMPTY_IDS))
 
             # Delete all incident edges (lock is reentrant, so nested calls work)
             edges_deleted = 0
@@ -396,53 +777,32 @@ class HypergraphCore:
             if existing is not None:
                 # Clean up old type index
                 if existing.type != edge.type:
-                    self._edges_by_type[existing.type].discard(edge.id)
-                    if not self._edges_by_type[existing.type]:
-                        del self._edges_by_type[existing.type]
+                    _discard_posting(self._edges_by_type, existing.type, edge.id)
+                if existing.source != edge.source:
+                    _discard_ordered_posting(self._edges_by_source, existing.source, edge.id)
                 # Clean up old node-to-edge indexes
-                old_node_ids = {
-                    inc.node_id for inc in existing.incidences if inc.node_id is not None
-                }
-                new_node_ids = {
-                    inc.node_id for inc in edge.incidences if inc.node_id is not None
-                }
-                for node_id in old_node_ids - new_node_ids:
-                    self._node_to_edges[node_id].discard(edge.id)
-                    if not self._node_to_edges[node_id]:
-                        del self._node_to_edges[node_id]
+                for node_id in existing.node_set - edge.node_set:
+                    _discard_posting(self._node_to_edges, node_id, edge.id)
                 # Clean up old edge-ref indexes
-                old_edge_refs = {
-                    inc.edge_ref_id
-                    for inc in existing.incidences
-                    if inc.edge_ref_id is not None
-                }
-                new_edge_refs = {
-                    inc.edge_ref_id
-                    for inc in edge.incidences
-                    if inc.edge_ref_id is not None
-                }
-                for ref_id in old_edge_refs - new_edge_refs:
-                    self._edge_to_edges[ref_id].discard(edge.id)
-                    if not self._edge_to_edges[ref_id]:
-                        del self._edge_to_edges[ref_id]
+                for ref_id in set(existing._edge_refs).difference(edge._edge_refs):
+                    _discard_posting(self._edge_to_edges, ref_id, edge.id)
                 # Clean up old vertex-set index
-                old_node_set_key = frozenset(existing.node_set)
-                new_node_set_key = frozenset(edge.node_set)
+                old_node_set_key = existing.node_set
+                new_node_set_key = edge.node_set
                 if old_node_set_key != new_node_set_key and old_node_set_key:
-                    self._edges_by_node_set[old_node_set_key].discard(edge.id)
-                    if not self._edges_by_node_set[old_node_set_key]:
-                        del self._edges_by_node_set[old_node_set_key]
+                    _discard_posting(self._edges_by_node_set, old_node_set_key, edge.id)
 
+            self._invalidate_path_cache()
             self._edges[edge.id] = edge
             self._edges_by_type[edge.type].add(edge.id)
-            for inc in edge.incidences:
-                if inc.node_id is not None:
-                    self._node_to_edges[inc.node_id].add(edge.id)
-                if inc.edge_ref_id is not None:
-                    self._edge_to_edges[inc.edge_ref_id].add(edge.id)
+            self._edges_by_source[edge.source][edge.id] = None
+            for node_id in edge.node_set:
+                self._node_to_edges[node_id].add(edge.id)
+            for ref_id in edge._edge_refs:
+                self._edge_to_edges[ref_id].add(edge.id)
             # Index by vertex set for O(1) lookup (multiple edges can share same node set)
             # Skip for edge-ref-only edges (empty node set would cause collisions)
-            node_set_key = frozenset(edge.node_set)
+            node_set_key = edge.node_set
             if node_set_key:
                 self._edges_by_node_set[node_set_key].add(edge.id)
 
@@ -454,11 +814,21 @@ class HypergraphCore:
     def get_edges_by_type(self, edge_type: str) -> list[Hyperedge]:
         """Get all hyperedges of a specific type."""
         with self._lock:
-            return [self._edges[eid] for eid in self._edges_by_type.get(edge_type, set())]
+            return [self._edges[eid] for eid in self._edges_by_type.get(edge_type, _EMPTY_IDS)]
+
+    def get_edges_by_source(self, source: str) -> list[Hyperedge]:
+        """Get all hyperedges with a specific provenance source.
+
+        Edges are listed in the order they were added under that source.
+        Updating an edge in place keeps its position, but moving it to another
+        source puts it at the end of that source's list.
+        """
+        with self._lock:
+            return [self._edges[eid] for eid in self._edges_by_source.get(source, _EMPTY_IDS)]
 
     def get_edges_containing(
         self,
-        node_ids: set[str],
+        node_ids: Collection[str],
         match_all: bool = False,
     ) -> list[Hyperedge]:
         """Find hyperedges containing the given nodes.
@@ -475,19 +845,24 @@ class HypergraphCore:
             if not node_ids:
                 return []
 
+            node_to_edges = self._node_to_edges
+            # .get() with a shared empty default: no per-miss allocation and
+            # no defaultdict insertion for unknown nodes
+            posting_lists = [node_to_edges.get(nid, _EMPTY_IDS) for nid in node_ids]
             if match_all:
-                # Intersection: edge must contain all specified nodes
-                edge_sets = [self._node_to_edges.get(nid, set()) for nid in node_ids]
-                if not edge_sets:
-                    return []
-                common_edges = set.intersection(*edge_sets)
-                return [self._edges[eid] for eid in common_edges]
+                # Intersection: edge must contain all specified nodes. Start from
+                # the shortest posting list so every step probes the fewest
+                # candidates, and stop as soon as nothing survives.
+                posting_lists.sort(key=len)
+                edge_ids: AbstractSet[str] = posting_lists[0]
+                for posting_list in posting_lists[1:]:
+                    if not edge_ids:
+                        break
+                    edge_ids = edge_ids & posting_list
             else:
                 # Union: edge must contain any specified node
-                all_edges: set[str] = set()
-                for nid in node_ids:
-                    all_edges.update(self._node_to_edges.get(nid, set()))
-                return [self._edges[eid] for eid in all_edges]
+                edge_ids = set().union(*posting_lists)
+            return [self._edges[eid] for eid in edge_ids]
 
     def find_edges(self, **properties: Any) -> list[Hyperedge]:
         """Find hyperedges matching all specified properties."""
@@ -503,27 +878,24 @@ class HypergraphCore:
         with self._lock:
             if edge_id not in self._edges:
                 return False
+            self._invalidate_path_cache()
             edge = self._edges[edge_id]
-            self._edges_by_type[edge.type].discard(edge_id)
             # Clean up empty type sets to prevent memory leaks
-            if not self._edges_by_type[edge.type]:
-                del self._edges_by_type[edge.type]
-            for inc in edge.incidences:
-                if inc.node_id is not None:
-                    self._node_to_edges[inc.node_id].discard(edge_id)
-                    # Clean up empty node-to-edge sets
-                    if not self._node_to_edges[inc.node_id]:
-                        del self._node_to_edges[inc.node_id]
-                if inc.edge_ref_id is not None:
-                    self._edge_to_edges[inc.edge_ref_id].discard(edge_id)
-                    if not self._edge_to_edges[inc.edge_ref_id]:
-                        del self._edge_to_edges[inc.edge_ref_id]
+            _discard_posting(self._edges_by_type, edge.type, edge_id)
+            _discard_ordered_posting(self._edges_by_source, edge.source, edge_id)
+            # Walk the edge's own cached views, so cleanup is O(arity) with no
+            # scan of the incidences; repeated refs are harmless to discard twice
+            node_to_edges = self._node_to_edges
+            for node_id in edge.node_set:
+                # Clean up empty node-to-edge sets
+                _discard_posting(node_to_edges, node_id, edge_id)
+            edge_to_edges = self._edge_to_edges
+            for ref_id in edge._edge_refs:
+                _discard_posting(edge_to_edges, ref_id, edge_id)
             # Remove from vertex-set index
-            node_set_key = frozenset(edge.node_set)
-            if node_set_key and node_set_key in self._edges_by_node_set:
-                self._edges_by_node_set[node_set_key].discard(edge_id)
-                if not self._edges_by_node_set[node_set_key]:
-                    del self._edges_by_node_set[node_set_key]
+            node_set_key = edge.node_set
+            if node_set_key:
+                _discard_posting(self._edges_by_node_set, node_set_key, edge_id)
             # Clean up this edge as a referenced target in _edge_to_edges
             if edge_id in self._edge_to_edges:
                 del self._edge_to_edges[edge_id]
@@ -557,7 +929,7 @@ class HypergraphCore:
         """
         with self._lock:
             neighbors: set[str] = set()
-            edge_ids = self._node_to_edges.get(node_id, set())
+            edge_ids = self._node_to_edges.get(node_id, _EMPTY_IDS)
 
             for edge_id in edge_ids:
                 edge = self._edges.get(edge_id)
@@ -589,7 +961,7 @@ class HypergraphCore:
             List of hyperedges containing the node
         """
         with self._lock:
-            edge_ids = self._node_to_edges.get(node_id, set())
+            edge_ids = self._node_to_edges.get(node_id, _EMPTY_IDS)
             if not edge_ids:
                 return []
 
@@ -602,6 +974,22 @@ class HypergraphCore:
                 if (edge := self._edges.get(eid)) is not None and edge.type in edge_types
             ]
 
+    def get_edges_referencing(self, edge_id: str) -> list[Hyperedge]:
+        """Get all hyperedges that reference an edge via edge_ref_id.
+
+        Served from the edge-to-edges reverse index, so the cost is
+        proportional to the number of referencing edges rather than the
+        size of the hypergraph.
+
+        Args:
+            edge_id: The referenced edge ID
+
+        Returns:
+            List of hyperedges whose incidences reference the edge
+        """
+        with self._lock:
+            return [self._edges[eid] for eid in self._edge_to_edges.get(edge_id, _EMPTY_IDS)]
+
     def get_edge_node_tuples_of_node(
         self,
         node_id: str,
@@ -624,7 +1012,7 @@ class HypergraphCore:
             Set of frozensets, each representing an incident edge's vertex set
         """
         with self._lock:
-            edge_ids = self._node_to_edges.get(node_id, set())
+            edge_ids = self._node_to_edges.get(node_id, _EMPTY_IDS)
             if not edge_ids:
                 return set()
 
@@ -635,7 +1023,7 @@ class HypergraphCore:
                     continue
                 if edge_types is not None and edge.type not in edge_types:
                     continue
-                result.add(frozenset(edge.node_set))
+                result.add(edge.node_set)
             return result
 
     def node_degree(
@@ -653,7 +1041,7 @@ class HypergraphCore:
             Edge count for the node
         """
         with self._lock:
-            edge_ids = self._node_to_edges.get(node_id, set())
+            edge_ids = self._node_to_edges.get(node_id, _EMPTY_IDS)
 
             if edge_types is None:
                 return len(edge_ids)
@@ -701,7 +1089,23 @@ class HypergraphCore:
             edge = self.get_edge_by_node_set(node_ids, edge_type)
             if edge is None:
                 return 0
-            return sum(self.node_degree(nid) for nid in edge.node_set)
+            return sum(self.vertex_degrees(edge.node_set).values())
+
+    def vertex_degrees(self, node_ids: Iterable[str]) -> dict[str, int]:
+        """Get the degree of each node in one pass.
+
+        Equivalent to calling node_degree() for every node without an
+        edge-type filter, but takes the lock once for the whole set.
+
+        Args:
+            node_ids: Node IDs to measure
+
+        Returns:
+            Dict mapping each node ID to its edge count (0 if unknown)
+        """
+        with self._lock:
+            node_to_edges = self._node_to_edges
+            return {nid: len(node_to_edges[nid]) if nid in node_to_edges else 0 for nid in node_ids}
 
     def get_edge_by_node_set(
         self,
@@ -812,10 +1216,8 @@ class HypergraphCore:
 
             # Update type index if type changed
             if existing.type != node.type:
-                self._nodes_by_type[existing.type].discard(node.id)
                 # Clean up empty type sets
-                if not self._nodes_by_type[existing.type]:
-                    del self._nodes_by_type[existing.type]
+                _discard_posting(self._nodes_by_type, existing.type, node.id)
                 self._nodes_by_type[node.type].add(node.id)
 
             if merge_properties:
@@ -865,35 +1267,30 @@ class HypergraphCore:
                 final_edge = edge
 
             # NOW remove old indexes (point of no return)
-            self._edges_by_type[existing.type].discard(edge.id)
+            self._invalidate_path_cache()
             # Clean up empty type sets
-            if not self._edges_by_type[existing.type]:
-                del self._edges_by_type[existing.type]
-            for inc in existing.incidences:
-                if inc.node_id is not None:
-                    self._node_to_edges[inc.node_id].discard(edge.id)
-                    if not self._node_to_edges[inc.node_id]:
-                        del self._node_to_edges[inc.node_id]
-                if inc.edge_ref_id is not None:
-                    self._edge_to_edges[inc.edge_ref_id].discard(edge.id)
-                    if not self._edge_to_edges[inc.edge_ref_id]:
-                        del self._edge_to_edges[inc.edge_ref_id]
+            _discard_posting(self._edges_by_type, existing.type, edge.id)
+            # Same-source updates keep the edge's place in the source index
+            if existing.source != final_edge.source:
+                _discard_ordered_posting(self._edges_by_source, existing.source, edge.id)
+            for node_id in existing.node_set:
+                _discard_posting(self._node_to_edges, node_id, edge.id)
+            for ref_id in set(existing._edge_refs):
+                _discard_posting(self._edge_to_edges, ref_id, edge.id)
             # Remove from vertex-set index
-            old_node_set_key = frozenset(existing.node_set)
-            if old_node_set_key and old_node_set_key in self._edges_by_node_set:
-                self._edges_by_node_set[old_node_set_key].discard(edge.id)
-                if not self._edges_by_node_set[old_node_set_key]:
-                    del self._edges_by_node_set[old_node_set_key]
+            old_node_set_key = existing.node_set
+            if old_node_set_key:
+                _discard_posting(self._edges_by_node_set, old_node_set_key, edge.id)
 
             # Re-add with updated indexes
             self._edges[final_edge.id] = final_edge
             self._edges_by_type[final_edge.type].add(final_edge.id)
-            for inc in final_edge.incidences:
-                if inc.node_id is not None:
-                    self._node_to_edges[inc.node_id].add(final_edge.id)
-                if inc.edge_ref_id is not None:
-                    self._edge_to_edges[inc.edge_ref_id].add(final_edge.id)
-            final_node_set_key = frozenset(final_edge.node_set)
+            self._edges_by_source[final_edge.source][final_edge.id] = None
+            for node_id in final_edge.node_set:
+                self._node_to_edges[node_id].add(final_edge.id)
+            for ref_id in final_edge._edge_refs:
+                self._edge_to_edges[ref_id].add(final_edge.id)
+            final_node_set_key = final_edge.node_set
             if final_node_set_key:
                 self._edges_by_node_set[final_node_set_key].add(final_edge.id)
 
@@ -978,6 +1375,10 @@ class HypergraphCore:
 
         Returns:
             List of paths, where each path is a list of hyperedges
+
+        Note:
+            Results are memoized per argument combination until the next
+            edge mutation (add, upsert, or delete).
         """
         if direction_mode not in ("undirected", "forward", "backward"):
             raise ValueError(
@@ -985,75 +1386,152 @@ class HypergraphCore:
                 f"got: {direction_mode!r}"
             )
 
+        cache_key = (
+            frozenset(start_nodes),
+            frozenset(end_nodes),
+            min_intersection,
+            max_hops,
+            max_paths,
+            frozenset(edge_types) if edge_types is not None else None,
+            direction_mode,
+        )
         with self._lock:
-            # Get starting edges (those containing any start node)
-            start_edges = self.get_edges_containing(start_nodes, match_all=False)
-            if edge_types:
-                start_edges = [e for e in start_edges if e.type in edge_types]
-
-            # Get target edges (those containing any end node)
-            target_edge_ids = {
-                e.id
-                for e in self.get_edges_containing(end_nodes, match_all=False)
-                if edge_types is None or e.type in edge_types
-            }
+            cached = self._path_cache.get(cache_key)
+            if cached is not None:
+                self._path_cache.move_to_end(cache_key)
+                return [list(path) for path in cached]
+
+            found_paths = self._find_paths_uncached(
+                start_nodes,
+                end_nodes,
+                min_intersection,
+                max_hops,
+                max_paths,
+                edge_types,
+                direction_mode,
+            )
+            self._path_cache[cache_key] = tuple(tuple(path) for path in found_paths)
+            if len(self._path_cache) > PATH_CACHE_SIZE:
+                self._path_cache.popitem(last=False)
+            return found_paths
 
-            # Early exit if no path is possible
-            if not start_edges or not target_edge_ids:
-                return []
+    def _find_paths_uncached(
+        self,
+        start_nodes: set[str],
+        end_nodes: set[str],
+        min_intersection: int,
+        max_hops: int,
+        max_paths: int,
+        edge_types: list[str] | None,
+        direction_mode: str,
+    ) -> list[list[Hyperedge]]:
+        """Run the path-finding BFS without consulting the memo.
 
-            # BFS for paths (using deque for O(1) popleft)
-            found_paths: list[list[Hyperedge]] = []
-            queue: deque[tuple[Hyperedge, list[Hyperedge]]] = deque(
-                (edge, [edge]) for edge in start_edges
-            )
-            visited: set[str] = {edge.id for edge in start_edges}
+        Note: This method assumes the caller holds the lock.
+        """
+        # Membership tests against a frozenset instead of the caller's list
+        type_filter = frozenset(edge_types) if edge_types else None
+
+        # Get starting edges (those containing any start node)
+        start_edges = self.get_edges_containing(start_nodes, match_all=False)
+        if type_filter:
+            start_edges = [e for e in start_edges if e.type in type_filter]
+
+        # Get target edges (those containing any end node)
+        target_edge_ids = {
+            e.id
+            for e in self.get_edges_containing(end_nodes, match_all=False)
+            if type_filter is None or e.type in type_filter
+        }
+
+        # Early exit if no path is possible
+        if not start_edges or not target_edge_ids:
+            return []
+
+        # BFS over edge IDs. Each visited edge records the edge it was reached
+        # from, so paths are rebuilt only when a target is hit instead of
+        # copying the partial path on every enqueue.
+        edges = self._edges
+        parents: dict[str, str | None] = {edge.id: None for edge in start_edges}
+        queue: deque[tuple[str, int]] = deque((edge.id, 1) for edge in start_edges)
+        found_paths: list[list[Hyperedge]] = []
+        undirected = direction_mode == "undirected"
+
+        while queue and len(found_paths) < max_paths:
+            edge_id, hops = queue.popleft()
+
+            # Check if we've reached a target
+            if edge_id in target_edge_ids:
+                path: list[Hyperedge] = []
+                step: str | None = edge_id
+                while step is not None:
+                    path.append(edges[step])
+                    step = parents[step]
+                path.reverse()
+                found_paths.append(path)
+                continue
+
+            # Don't extend beyond max_hops
+            if hops >= max_hops:
+                continue
 
-            while queue and len(found_paths) < max_paths:
-                current_edge, path = queue.popleft()
+            if undirected:
+                # Shared-node counts give the intersection sizes directly
+                for other_id, shared in self._edge_neighbors(edges[edge_id]).items():
+                    if shared < min_intersection or other_id in parents:
+                        continue
+                    if type_filter and edges[other_id].type not in type_filter:
+                        continue
+                    parents[other_id] = edge_id
+                    queue.append((other_id, hops + 1))
+                continue
 
-                # Check if we've reached a target
-                if current_edge.id in target_edge_ids:
-                    found_paths.append(path)
-                    continue
+            for next_edge in self._find_adjacent_edges(
+                edges[edge_id],
+                min_intersection,
+                direction_mode,
+                type_filter,
+            ):
+                if next_edge.id not in parents:
+                    parents[next_edge.id] = edge_id
+                    queue.append((next_edge.id, hops + 1))
 
-                # Don't extend beyond max_hops
-                if len(path) >= max_hops:
-                    continue
+        return found_paths
 
-                # Find adjacent edges based on direction mode
-                adjacent = self._find_adjacent_edges(
-                    current_edge,
-                    min_intersection,
-                    direction_mode,
-                    edge_types,
-                )
+    def _edge_neighbors(self, edge: Hyperedge) -> dict[str, int]:
+        """Get edges sharing nodes with ``edge``, mapped to the shared node count.
 
-                for next_edge in adjacent:
-                    if next_edge.id not in visited:
-                        visited.add(next_edge.id)
-                        queue.append((next_edge, path + [next_edge]))
+        Counted from the node-to-edges index on each call. Path finding
+        expands every edge at most once per search, so nothing is kept
+        between calls.
 
-            return found_paths
+        Note: This method assumes the caller holds the lock.
+        """
+        neighbors: dict[str, int] = {}
+        node_to_edges = self._node_to_edges
+        for node_id in edge.node_set:
+            for other_id in node_to_edges.get(node_id, _EMPTY_IDS):
+                neighbors[other_id] = neighbors.get(other_id, 0) + 1
+        neighbors.pop(edge.id, None)
+        return neighbors
 
     def _find_adjacent_edges(
         self,
         edge: Hyperedge,
         min_intersection: int,
         direction_mode: str,
-        edge_types: list[str] | None,
+        edge_types: Collection[str] | None,
     ) -> list[Hyperedge]:
         """Find edges adjacent to the given edge based on intersection constraint.
 
+        Handles the "forward" and "backward" modes only; undirected searches
+        expand straight from _edge_neighbors() in _find_paths_uncached().
+
         Note: This method assumes the caller holds the lock.
         """
-        # Determine which nodes to use for intersection based on direction mode
-        if direction_mode == "undirected":
-            source_nodes = edge.node_set
-        elif direction_mode == "forward":
-            source_nodes = set(edge.head_nodes) if edge.head_nodes else edge.node_set
-        else:  # backward
-            source_nodes = set(edge.tail_nodes) if edge.tail_nodes else edge.node_set
+        # Directed modes intersect head/tail subsets, precomputed on each edge
+        forward = direction_mode == "forward"
+        source_nodes = edge._head_set if forward else edge._tail_set
 
         # Get candidate edges (any edge sharing at least one node)
         candidates = self.get_edges_containing(source_nodes, match_all=False)
@@ -1066,17 +1544,8 @@ class HypergraphCore:
             if candidate.id == edge.id:
                 continue
 
-            # Determine target nodes based on direction mode
-            if direction_mode == "undirected":
-                target_nodes = candidate.node_set
-            elif direction_mode == "forward":
-                target_nodes = (
-                    set(candidate.tail_nodes) if candidate.tail_nodes else candidate.node_set
-                )
-            else:  # backward
-                target_nodes = (
-                    set(candidate.head_nodes) if candidate.head_nodes else candidate.node_set
-                )
+            # Forward steps land on the candidate's tail, backward on its head
+            target_nodes = candidate._tail_set if forward else candidate._head_set
 
             # Check intersection constraint
             intersection_size = len(source_nodes & target_nodes)
@@ -1087,9 +1556,21 @@ class HypergraphCore:
 
     # ========== Statistics & Validation ==========
 
+    def counts(self) -> tuple[int, int]:
+        """Get the number of nodes and edges without building per-type breakdowns.
+
+        Returns:
+            Tuple of (num_nodes, num_edges)
+        """
+        with self._lock:
+            return len(self._nodes), len(self._edges)
+
     def stats(self) -> dict[str, Any]:
         """Get hypergraph statistics.
 
+        Read straight from the maintained type indexes: O(number of types),
+        with no scan over nodes or edges.
+
         Returns:
             Dict with num_nodes, num_edges, nodes_by_type, edges_by_type
         """
@@ -1101,6 +1582,22 @@ class HypergraphCore:
                 "edges_by_type": {t: len(ids) for t, ids in self._edges_by_type.items()},
             }
 
+    def source_stats(self) -> dict[str, tuple[int, float]]:
+        """Get edge count and mean confidence per provenance source.
+
+        Walks the maintained source index, so edges are grouped without
+        building a list of every edge first.
+
+        Returns:
+            Dict mapping source -> (edge_count, avg_confidence)
+        """
+        with self._lock:
+            edges = self._edges
+            return {
+                source: (len(ids), math.fsum(edges[eid].confidence for eid in ids) / len(ids))
+                for source, ids in self._edges_by_source.items()
+            }
+
     def validate(self) -> dict[str, Any]:
         """Validate hypergraph integrity and detect orphaned references.
 
@@ -1109,7 +1606,7 @@ class HypergraphCore:
         - Edges referencing non-existent edges via edge_ref_id
         - Node-to-edges index consistency
         - Edge-to-edges index consistency
-        - Type index consistency
+        - Type and source index consistency
 
         Returns:
             Dict with 'valid' (bool), 'errors' (list of error descriptions),
@@ -1119,15 +1616,23 @@ class HypergraphCore:
             errors: list[str] = []
             orphaned_edges: list[str] = []
 
-            # Check for edges referencing non-existent nodes or edges
+            # Check for edges referencing non-existent nodes or edges. The
+            # node-to-edges index keeps its key when a node is deleted, so
+            # dangling node references fall out of one set difference and only
+            # edges posted under a dangling key need their nodes inspected.
+            # Edge refs are checked from each edge's cached edge_ref tuple
+            # because deleting a referenced edge drops its index key.
+            dangling_nodes = self._node_to_edges.keys() - self._nodes.keys()
+            affected: set[str] = set()
+            for node_id in dangling_nodes:
+                affected.update(self._node_to_edges[node_id])
+
             for edge_id, edge in self._edges.items():
-                missing_nodes = []
-                missing_edge_refs = []
-                for inc in edge.incidences:
-                    if inc.node_id is not None and inc.node_id not in self._nodes:
-                        missing_nodes.append(inc.node_id)
-                    if inc.edge_ref_id is not None and inc.edge_ref_id not in self._edges:
-                        missing_edge_refs.append(inc.edge_ref_id)
+                if edge_id in affected:
+                    missing_nodes = [n for n in edge._nodes if n in dangling_nodes]
+                else:
+                    missing_nodes = []
+                missing_edge_refs = [r for r in edge._edge_refs if r not in self._edges]
                 if missing_nodes:
                     orphaned_edges.append(edge_id)
                     errors.append(
@@ -1142,7 +1647,7 @@ class HypergraphCore:
 
             # Verify node-to-edges index consistency
             for node_id, edge_ids in self._node_to_edges.items():
-                if node_id not in self._nodes:
+                if node_id in dangling_nodes:
                     errors.append(f"Node-to-edges index contains non-existent node: '{node_id}'")
                 for edge_id in edge_ids:
                     if edge_id not in self._edges:
@@ -1182,6 +1687,15 @@ class HypergraphCore:
                             f"non-existent edge: '{edge_id}'"
                         )
 
+            # Verify source index
+            for source, source_ids in self._edges_by_source.items():
+                for edge_id in source_ids:
+                    if edge_id not in self._edges:
+                        errors.append(
+                            f"Edges-by-source index for '{source}' contains "
+                            f"non-existent edge: '{edge_id}'"
+                        )
+
             return {
                 "valid": len(errors) == 0,
                 "errors": errors,
@@ -1208,7 +1722,7 @@ class HypergraphCore:
                         "type": e.type,
                         "incidences": [
                             {
-                                **( {"node_id": inc.node_id} if inc.node_id is not None else {}),
+                                **({"node_id": inc.node_id} if inc.node_id is not None else {}),
                                 **(
                                     {"edge_ref_id": inc.edge_ref_id}
                                     if inc.edge_ref_id is not None
@@ -1230,35 +1744,43 @@ class HypergraphCore:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "HypergraphCore":
         """Import from simple dict."""
-        store = cls()
-        for node_data in data.get("nodes", []):
-            store.add_node(
-                Node(
-                    id=node_data["id"],
-                    type=node_data["type"],
-                    properties=node_data.get("properties", {}),
-                )
+        nodes = (
+            Node(
+                id=node_data["id"],
+                type=node_data["type"],
+                properties=node_data.get("properties", {}),
             )
-        for edge_data in data.get("edges", []):
-            store.add_edge(
-                Hyperedge(
-                    id=edge_data["id"],
-                    type=edge_data["type"],
-                    incidences=[
-                        Incidence(
-                            node_id=inc.get("node_id"),
-                            edge_ref_id=inc.get("edge_ref_id"),
-                            direction=inc.get("direction"),
-                            properties=inc.get("properties", {}),
-                        )
-                        for inc in edge_data["incidences"]
-                    ],
-                    properties=edge_data.get("properties", {}),
-                    source=edge_data.get("source", "unknown"),
-                    confidence=edge_data.get("confidence", 1.0),
-                )
+            for node_data in data.get("nodes", [])
+        )
+        edges = (
+            Hyperedge(
+                id=edge_data["id"],
+                type=edge_data["type"],
+                incidences=[
+                    Incidence(
+                        node_id=inc.get("node_id"),
+                        edge_ref_id=inc.get("edge_ref_id"),
+                        direction=inc.get("direction"),
+                        properties=inc.get("properties", {}),
+                    )
+                    for inc in edge_data["incidences"]
+                ],
+                properties=edge_data.get("properties", {}),
+                source=edge_data.get("source", "unknown"),
+                confidence=edge_data.get("confidence", 1.0),
             )
-        return store
+            for edge_data in data.get("edges", [])
+        )
+        return cls.from_iter(nodes, edges)
+
+    @classmethod
+    def from_dict_json(cls, data: bytes | str) -> "HypergraphCore":
+        """Import from to_dict_json() output.
+
+        Parses with orjson when installed, falling back to the standard
+        library json module.
+        """
+        return cls.from_dict(_loads_json(data))
 
     def to_hif(self) -> dict[str, Any]:
         """Export to HIF-compliant JSON structure.
@@ -1272,49 +1794,41 @@ class HypergraphCore:
         - "network-type" field indicates directed/undirected/asc
         """
         with self._lock:
-            # Flatten all incidences into root-level array
+            # One pass over edges fills the flat incidence array, the edges array
+            # and the directedness flag together.
             # Edge-ref incidences are not part of HIF standard; only export node-based ones
             hif_incidences: list[dict[str, Any]] = []
+            hif_edges: list[dict[str, Any]] = []
             skipped_edge_refs = 0
+            has_direction = False
             for edge in self._edges.values():
+                edge_id = edge.id
                 for inc in edge.incidences:
                     if inc.node_id is None:
                         skipped_edge_refs += 1
                         continue  # Skip edge-ref incidences (not representable in HIF)
-                    hif_inc: dict[str, Any] = {
-                        "node": inc.node_id,
-                        "edge": edge.id,
-                    }
+                    hif_inc: dict[str, Any] = {"node": inc.node_id, "edge": edge_id}
                     if inc.direction:
                         hif_inc["direction"] = inc.direction
                     if inc.properties:
                         hif_inc["attrs"] = inc.properties
                     hif_incidences.append(hif_inc)
 
-            # Build nodes array with HIF field naming
-            hif_nodes: list[dict[str, Any]] = []
-            for node in self._nodes.values():
-                hif_node: dict[str, Any] = {"node": node.id}
-                node_attrs = dict(node.properties)
-                node_attrs["_type"] = node.type
-                hif_node["attrs"] = node_attrs
-                hif_nodes.append(hif_node)
-
-            # Build edges array with HIF field naming
-            hif_edges: list[dict[str, Any]] = []
-            for edge in self._edges.values():
-                hif_edge: dict[str, Any] = {"edge": edge.id}
                 edge_attrs: dict[str, Any] = {"_type": edge.type}
                 if edge.source != "unknown":
                     edge_attrs["_source"] = edge.source
                 if edge.confidence != 1.0:
                     edge_attrs["_confidence"] = edge.confidence
                 edge_attrs.update(edge.properties)
-                hif_edge["attrs"] = edge_attrs
-                hif_edges.append(hif_edge)
+                hif_edges.append({"edge": edge_id, "attrs": edge_attrs})
+                has_direction = has_direction or edge.is_directed
+
+            # Build nodes array with HIF field naming
+            hif_nodes = [
+                {"node": node.id, "attrs": {**node.properties, "_type": node.type}}
+                for node in self._nodes.values()
+            ]
 
-            # Determine network type based on edge directionality
-            has_direction = any(edge.is_directed for edge in self._edges.values())
             network_type = "directed" if has_direction else "undirected"
 
             metadata: dict[str, Any] = {
@@ -1332,6 +1846,28 @@ class HypergraphCore:
                 "edges": hif_edges,
             }
 
+    def to_dict_json(self, indent: bool = False) -> bytes:
+        """Export to_dict() output as UTF-8 encoded JSON.
+
+        Uses orjson when installed (``pip install hypabase[speedups]``),
+        falling back to the standard library json module.
+
+        Args:
+            indent: If True, pretty-print with two-space indentation
+        """
+        return _dumps_json(self.to_dict(), indent)
+
+    def to_hif_json(self, indent: bool = False) -> bytes:
+        """Export to_hif() output as UTF-8 encoded JSON.
+
+        Uses orjson when installed (``pip install hypabase[speedups]``),
+        falling back to the standard library json module.
+
+        Args:
+            indent: If True, pretty-print with two-space indentation
+        """
+        return _dumps_json(self.to_hif(), indent)
+
     @classmethod
     def from_hif(
         cls,
@@ -1360,7 +1896,8 @@ class HypergraphCore:
         Raises:
             ValueError: In strict mode, if nodes or edges need to be auto-created
         """
-        store = cls()
+        # Records are collected first and indexed once via from_iter()
+        nodes: dict[str, Node] = {}
         auto_created_nodes: list[str] = []
         auto_created_edges: list[str] = []
 
@@ -1382,12 +1919,10 @@ class HypergraphCore:
             node_id = str(hif_node["node"])
             attrs = dict(hif_node.get("attrs", {}))
             node_type = attrs.pop("_type", "unknown")
-            store.add_node(
-                Node(
-                    id=node_id,
-                    type=node_type,
-                    properties=attrs,
-                )
+            nodes[node_id] = Node(
+                id=node_id,
+                type=node_type,
+                properties=attrs,
             )
 
         # Process root-level incidences array (HIF standard)
@@ -1396,9 +1931,9 @@ class HypergraphCore:
             node_id = str(hif_inc["node"])
 
             # Auto-create node if not in nodes array
-            if store.get_node(node_id) is None:
+            if node_id not in nodes:
                 auto_created_nodes.append(node_id)
-                store.add_node(Node(id=node_id, type="unknown"))
+                nodes[node_id] = Node(id=node_id, type="unknown")
 
             # Auto-create edge entry if not in edges array
             if edge_id not in edge_data:
@@ -1420,19 +1955,6 @@ class HypergraphCore:
                 )
             )
 
-        # Create edges with collected incidences
-        for edge_id, edata in edge_data.items():
-            store.add_edge(
-                Hyperedge(
-                    id=edge_id,
-                    type=edata["type"],
-                    incidences=edata["incidences"],
-                    properties=edata["properties"],
-                    source=edata["source"],
-                    confidence=edata["confidence"],
-                )
-            )
-
         # In strict mode, raise if any auto-creation occurred
         if strict and (auto_created_nodes or auto_created_edges):
             errors = []
@@ -1442,7 +1964,28 @@ class HypergraphCore:
                 errors.append(f"Auto-created {len(auto_created_edges)} edges: {auto_created_edges}")
             raise ValueError(f"HIF import validation failed (strict mode): {'; '.join(errors)}")
 
-        return store
+        # Create edges with collected incidences
+        edges = (
+            Hyperedge(
+                id=edge_id,
+                type=edata["type"],
+                incidences=edata["incidences"],
+                properties=edata["properties"],
+                source=edata["source"],
+                confidence=edata["confidence"],
+            )
+            for edge_id, edata in edge_data.items()
+        )
+        return cls.from_iter(nodes.values(), edges)
+
+    @classmethod
+    def from_hif_json(cls, data: bytes | str, strict: bool = False) -> "HypergraphCore":
+        """Import from HIF JSON text or bytes, such as to_hif_json() output.
+
+        Parses with orjson when installed, falling back to the standard
+        library json module. See from_hif() for the import rules.
+        """
+        return cls.from_hif(_loads_json(data), strict=strict)
 
 
 # Backward compatibility alias
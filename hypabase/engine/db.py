@@ -90,10 +90,17 @@ class HypergraphDB:
         Returns:
             The HypergraphCore for the namespace (created if needed)
         """
+        # Lock-free fast path: dict.get is atomic under the GIL, and existing
+        # namespaces are by far the common case
+        store = self._namespaces.get(name)
+        if store is not None:
+            return store
         with self._db_lock:
-            if name not in self._namespaces:
-                self._namespaces[name] = HypergraphCore()
-            return self._namespaces[name]
+            # Re-check under the lock so concurrent creators share one store
+            store = self._namespaces.get(name)
+            if store is None:
+                store = self._namespaces[name] = HypergraphCore()
+            return store
 
     def select(self, namespace: str) -> "HypergraphDB":
         """Switch to a namespace, creating it if needed.
@@ -108,8 +115,7 @@ class HypergraphDB:
             Self for method chaining
         """
         with self._db_lock:
-            if namespace not in self._namespaces:
-                self._namespaces[namespace] = HypergraphCore()
+            self.namespace(namespace)
             self._current_namespace = namespace
             return self
 
@@ -189,7 +195,8 @@ class HypergraphDB:
             if target in self._namespaces:
                 raise ValueError(f"Target namespace already exists: {target}")
 
-            # Deep copy using copy.deepcopy for better performance
+            # Every record gets its own property dicts, so changes to the copy
+            # never reach the source (see HypergraphCore.__deepcopy__)
             self._namespaces[target] = copy.deepcopy(self._namespaces[source])
 
             return self
@@ -214,12 +221,13 @@ class HypergraphDB:
             namespace_stats: dict[str, dict[str, int]] = {}
 
             for name, store in self._namespaces.items():
-                store_stats = store.stats()
-                total_nodes += store_stats["num_nodes"]
-                total_edges += store_stats["num_edges"]
+                # Only totals are reported, so skip the per-type breakdowns
+                num_nodes, num_edges = store.counts()
+                total_nodes += num_nodes
+                total_edges += num_edges
                 namespace_stats[name] = {
-                    "num_nodes": store_stats["num_nodes"],
-                    "num_edges": store_stats["num_edges"],
+                    "num_nodes": num_nodes,
+                    "num_edges": num_edges,
                 }
 
             return {
@@ -248,12 +256,13 @@ class HypergraphDB:
 
     # ========== Persistence ==========
 
-    def save(self, path: str, format: Literal["json", "hif"] = "json") -> None:
+    def save(self, path: str, format: Literal["json", "hif", "msgpack"] = "json") -> None:
         """Save all namespaces to a directory.
 
         Args:
             path: Output directory path
-            format: "json" for internal dict format, "hif" for HIF standard
+            format: "json" for internal dict format, "hif" for HIF standard,
+                "msgpack" for a single msgpack file (requires msgpack)
         """
         with self._db_lock:
             save_db(self._namespaces, path, format)
@@ -262,7 +271,7 @@ class HypergraphDB:
     def load(
         cls,
         path: str,
-        format: Literal["json", "hif"] | None = None,
+        format: Literal["json", "hif", "msgpack"] | None = None,
     ) -> "HypergraphDB":
         """Load a database from a directory.
 
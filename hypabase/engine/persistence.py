@@ -11,6 +11,11 @@ Directory structure for multi-namespace save:
         |-- entities.json
         |-- themes.json
 
+With format="msgpack" every namespace's dict form is packed into a single
+namespaces.mpk file next to the manifest instead. Loading memory-maps that
+file and unpacks it in place. Requires the optional msgpack package
+(``pip install hypabase[msgpack]``).
+
 Security:
     Path validation is performed to prevent path traversal attacks.
     All paths are resolved to absolute paths and validated.
@@ -18,16 +23,48 @@ Security:
 
 from __future__ import annotations
 
+import importlib
 import json
+import mmap
 from pathlib import Path
 from typing import Any, Literal
 
 from .core import HypergraphCore
 
-FormatType = Literal["json", "hif"]
+FormatType = Literal["json", "hif", "msgpack"]
 
 MANIFEST_VERSION = "1.0"
 
+MSGPACK_FILENAME = "namespaces.mpk"
+
+
+def _msgpack() -> Any:
+    """Import msgpack on demand, explaining how to install it if missing."""
+    try:
+        return importlib.import_module("msgpack")
+    except ImportError as e:
+        raise ImportError(
+            "The msgpack format requires the msgpack package: pip install hypabase[msgpack]"
+        ) from e
+
+
+def _pack_msgpack(data: Any) -> bytes:
+    """Pack data with msgpack."""
+    packed: bytes = _msgpack().packb(data, use_bin_type=True)
+    return packed
+
+
+def _write_msgpack(path: Path, data: Any) -> None:
+    """Pack data with msgpack and write it to path."""
+    path.write_bytes(_pack_msgpack(data))
+
+
+def _read_msgpack(path: Path) -> Any:
+    """Unpack a msgpack file straight from a read-only memory map."""
+    msgpack = _msgpack()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return msgpack.unpackb(mm, raw=False, strict_map_key=False)
+
 
 def _validate_path(path: str, base_dir: Path | None = None) -> Path:
     """Validate and resolve a file path.
@@ -99,7 +136,8 @@ def save_store(
     Args:
         store: The store to save
         path: Output file path
-        format: "json" for internal dict format, "hif" for HIF standard
+        format: "json" for internal dict format, "hif" for HIF standard,
+            "msgpack" for the internal dict format packed with msgpack
 
     Raises:
         ValueError: If path is invalid or format is unknown
@@ -107,17 +145,20 @@ def save_store(
     validated_path = _validate_path(path)
 
     if format == "json":
-        data = store.to_dict()
+        data = store.to_dict_json(indent=True)
     elif format == "hif":
-        data = store.to_hif()
+        data = store.to_hif_json(indent=True)
+    elif format == "msgpack":
+        validated_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_msgpack(validated_path, store.to_dict())
+        return
     else:
         raise ValueError(f"Unknown format: {format!r}")
 
     # Ensure parent directory exists
     validated_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(validated_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    validated_path.write_bytes(data)
 
 
 def load_store(
@@ -128,7 +169,8 @@ def load_store(
 
     Args:
         path: Input file path
-        format: "json" for internal dict format, "hif" for HIF standard
+        format: "json" for internal dict format, "hif" for HIF standard,
+            "msgpack" for the internal dict format packed with msgpack
 
     Returns:
         Loaded HypergraphCore
@@ -139,13 +181,13 @@ def load_store(
     """
     validated_path = _validate_path(path)
 
-    with open(validated_path, encoding="utf-8") as f:
-        data = json.load(f)
+    if format == "msgpack":
+        return HypergraphCore.from_dict(_read_msgpack(validated_path))
 
     if format == "json":
-        return HypergraphCore.from_dict(data)
+        return HypergraphCore.from_dict_json(validated_path.read_bytes())
     elif format == "hif":
-        return HypergraphCore.from_hif(data)
+        return HypergraphCore.from_hif_json(validated_path.read_bytes())
     else:
         raise ValueError(f"Unknown format: {format!r}")
 
@@ -181,7 +223,8 @@ def save_db(
     Args:
         namespaces: Dict mapping namespace names to stores
         path: Output directory path
-        format: "json" for internal dict format, "hif" for HIF standard
+        format: "json" for internal dict format, "hif" for HIF standard,
+            "msgpack" for all namespaces packed into one msgpack file
 
     Raises:
         ValueError: If path is invalid or namespace paths attempt traversal
@@ -193,6 +236,13 @@ def save_db(
     for namespace in namespaces:
         _validate_namespace_path(namespace, base_path)
 
+    # Pack msgpack saves up front so a failure leaves any existing save intact
+    packed = None
+    if format == "msgpack":
+        packed = _pack_msgpack(
+            {namespace: store.to_dict() for namespace, store in namespaces.items()}
+        )
+
     # Build manifest
     manifest: dict[str, Any] = {
         "version": MANIFEST_VERSION,
@@ -205,6 +255,10 @@ def save_db(
     with open(manifest_path, "w", encoding="utf-8") as f:
         json.dump(manifest, f, indent=2, ensure_ascii=False)
 
+    if packed is not None:
+        (base_path / MSGPACK_FILENAME).write_bytes(packed)
+        return
+
     # Write each namespace
     for namespace, store in namespaces.items():
         file_path = _validate_namespace_path(namespace, base_path)
@@ -213,12 +267,11 @@ def save_db(
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "json":
-            data = store.to_dict()
+            data = store.to_dict_json(indent=True)
         else:
-            data = store.to_hif()
+            data = store.to_hif_json(indent=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        file_path.write_bytes(data)
 
 
 def load_db(
@@ -249,16 +302,19 @@ def load_db(
 
     namespaces: dict[str, HypergraphCore] = {}
 
+    if actual_format == "msgpack":
+        packed = _read_msgpack(base_path / MSGPACK_FILENAME)
+        for namespace in manifest.get("namespaces", []):
+            namespaces[namespace] = HypergraphCore.from_dict(packed[namespace])
+        return namespaces
+
     for namespace in manifest.get("namespaces", []):
         file_path = _validate_namespace_path(namespace, base_path)
 
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
-
         if actual_format == "json":
-            store = HypergraphCore.from_dict(data)
+            store = HypergraphCore.from_dict_json(file_path.read_bytes())
         else:
-            store = HypergraphCore.from_hif(data)
+            store = HypergraphCore.from_hif_json(file_path.read_bytes())
 
         namespaces[namespace] = store
 
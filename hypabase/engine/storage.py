@@ -13,6 +13,7 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
+from collections.abc import Iterable
 from pathlib import Path
 
 from hypabase.engine.core import (
@@ -80,7 +81,7 @@ CREATE INDEX IF NOT EXISTS idx_incidences_ns ON incidences(namespace);
 """
 
 
-def _vertex_set_hash(node_ids: set[str]) -> str:
+def _vertex_set_hash(node_ids: Iterable[str]) -> str:
     key = "|".join(sorted(node_ids))
     return hashlib.sha256(key.encode()).hexdigest()
 
@@ -276,20 +277,22 @@ class SQLiteStorage:
 
     def load_namespace(self, namespace: str) -> HypergraphCore:
         """Load a single namespace from SQLite."""
-        store = HypergraphCore()
         conn = self._conn
 
-        for row in conn.execute(
-            "SELECT id, type, properties FROM nodes WHERE namespace = ?",
-            (namespace,),
-        ).fetchall():
-            store.add_node(Node(id=row[0], type=row[1], properties=json.loads(row[2])))
+        nodes = [
+            Node(id=row[0], type=row[1], properties=json.loads(row[2]))
+            for row in conn.execute(
+                "SELECT id, type, properties FROM nodes WHERE namespace = ?",
+                (namespace,),
+            ).fetchall()
+        ]
 
         edge_rows = conn.execute(
             "SELECT id, type, source, confidence, properties FROM edges WHERE namespace = ?",
             (namespace,),
         ).fetchall()
 
+        edges: list[Hyperedge] = []
         for erow in edge_rows:
             edge_id, etype, source, confidence, props_json = erow
             inc_rows = conn.execute(
@@ -306,7 +309,7 @@ class SQLiteStorage:
                 )
                 for ir in inc_rows
             ]
-            store.add_edge(
+            edges.append(
                 Hyperedge(
                     id=edge_id,
                     type=etype,
@@ -317,7 +320,7 @@ class SQLiteStorage:
                 )
             )
 
-        return store
+        return HypergraphCore.from_iter(nodes, edges)
 
     def list_namespaces(self) -> list[str]:
         """List all namespaces that have data in SQLite."""
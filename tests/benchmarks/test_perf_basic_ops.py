@@ -2,6 +2,8 @@
 
 import time
 
+import pytest
+
 from hypabase.engine import Hyperedge, Incidence, Node
 
 
@@ -119,6 +121,22 @@ class TestEdgeOperationsPerformance:
         assert elapsed < 0.01, f"1K vertex-set lookups took {elapsed:.3f}s"
 
 
+class TestRecordConstructionPerformance:
+    """Benchmarks for building Hyperedge records."""
+
+    @pytest.mark.parametrize("arity", [2, 4, 16])
+    def test_hyperedge_construction_performance(self, arity):
+        """Report Hyperedge construction time for common small arities."""
+        incidences = [Incidence(f"node_{i}") for i in range(arity)]
+        start = time.perf_counter()
+        for i in range(10000):
+            edge = Hyperedge(f"edge_{i}", "test", incidences)
+        elapsed = time.perf_counter() - start
+
+        print(f"Building 10K {arity}-ary edges: {elapsed:.3f}s")
+        assert len(edge.node_set) == arity
+
+
 class TestNeighborOperationsPerformance:
     """Benchmarks for neighbor operations."""
 
@@ -129,6 +129,52 @@ class TestSerializationPerformance:
             assert json_time < 10.0
             assert hif_time < 10.0
 
+    def test_hif_bulk_import_valid_directions(self):
+        """Import 100K directed HIF incidences and report the time taken."""
+        directions = ("head", "tail", None)
+        hif = {
+            "incidences": [
+                {"node": f"n{i % 20000}", "edge": f"e{i // 4}", "direction": directions[i % 3]}
+                for i in range(100_000)
+            ],
+        }
+
+        start = time.perf_counter()
+        store = HypergraphStore.from_hif(hif)
+        elapsed = time.perf_counter() - start
+
+        print(f"HIF import of 100K incidences: {elapsed:.3f}s")
+        assert store.stats()["num_edges"] == 25_000
+
+
+class TestBulkLoadPerformance:
+    """Benchmarks for bulk loading versus per-record inserts."""
+
+    def test_bulk_add_vs_add_edge(self, graph_10k):
+        """bulk_add builds the same store as inserting records one at a time."""
+        nodes = graph_10k.get_all_nodes()
+        edges = graph_10k.get_all_edges()
+
+        start = time.perf_counter()
+        incremental = HypergraphStore()
+        for node in nodes:
+            incremental.add_node(node)
+        for edge in edges:
+            incremental.add_edge(edge)
+        incremental_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk = HypergraphStore.from_iter(nodes, edges)
+        bulk_time = time.perf_counter() - start
+
+        print(f"Per-record load: {incremental_time:.3f}s")
+        print(f"Bulk load: {bulk_time:.3f}s")
+
+        assert bulk.stats() == incremental.stats()
+        assert bulk.get_all_nodes() == incremental.get_all_nodes()
+        assert bulk.get_all_edges() == incremental.get_all_edges()
+        assert bulk.validate()["valid"] is True
+
 
 class TestFileSize:
     """Benchmarks for serialized file sizes."""
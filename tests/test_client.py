@@ -7,6 +7,51 @@ import pytest
 from hypabase import Hypabase
 from hypabase.engine.storage import SQLiteStorage
 
+# v3 schema DDL; {node_id_null} toggles the NOT NULL constraint on incidences.node_id
+V3_SCHEMA_TEMPLATE = """
+    CREATE TABLE meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    CREATE TABLE nodes (
+        id TEXT NOT NULL,
+        namespace TEXT NOT NULL DEFAULT 'default',
+        type TEXT NOT NULL DEFAULT 'unknown',
+        properties TEXT NOT NULL DEFAULT '{{}}',
+        PRIMARY KEY (id, namespace)
+    );
+    CREATE TABLE edges (
+        id TEXT NOT NULL,
+        namespace TEXT NOT NULL DEFAULT 'default',
+        type TEXT NOT NULL,
+        source TEXT NOT NULL DEFAULT 'unknown',
+        confidence REAL NOT NULL DEFAULT 1.0,
+        properties TEXT NOT NULL DEFAULT '{{}}',
+        PRIMARY KEY (id, namespace)
+    );
+    CREATE TABLE incidences (
+        edge_id TEXT NOT NULL,
+        namespace TEXT NOT NULL DEFAULT 'default',
+        node_id TEXT {node_id_null},
+        position INTEGER NOT NULL,
+        direction TEXT,
+        properties TEXT NOT NULL DEFAULT '{{}}',
+        PRIMARY KEY (edge_id, namespace, position),
+        FOREIGN KEY (edge_id, namespace)
+            REFERENCES edges(id, namespace) ON DELETE CASCADE
+    );
+    CREATE TABLE vertex_set_index (
+        vertex_set_hash TEXT NOT NULL,
+        edge_id TEXT NOT NULL,
+        namespace TEXT NOT NULL DEFAULT 'default',
+        PRIMARY KEY (vertex_set_hash, edge_id, namespace),
+        FOREIGN KEY (edge_id, namespace)
+            REFERENCES edges(id, namespace) ON DELETE CASCADE
+    );
+"""
+V3_SCHEMA_STRICT = V3_SCHEMA_TEMPLATE.format(node_id_null="NOT NULL")
+V3_SCHEMA_NULLABLE = V3_SCHEMA_TEMPLATE.format(node_id_null="")
+
 
 class TestNodes:
     def test_create_node(self):
@@ -46,6 +91,15 @@ class TestNodes:
         assert node.properties["age"] == 30
         assert node.properties["role"] == "engineer"
 
+    def test_update_node_type_reindexes(self):
+        hb = Hypabase()
+        hb.node("alice", type="person", age=30)
+        node = hb.node("alice", type="admin", role="owner")
+        assert node.type == "admin"
+        assert node.properties == {"age": 30, "role": "owner"}
+        assert hb.nodes(type="person") == []
+        assert [n.id for n in hb.nodes(type="admin")] == ["alice"]
+
 
 class TestEdges:
     def test_create_edge(self):
@@ -187,6 +241,14 @@ class TestTraversal:
         paths = hb.paths("a", "d", max_hops=1)
         assert len(paths) == 0
 
+    def test_find_paths_end_outside_edge_types(self):
+        hb = Hypabase()
+        hb.edge(["a", "b"], type="link")
+        hb.edge(["b", "c"], type="other")
+        assert hb.paths("a", "c", edge_types=["link"]) == []
+        assert hb.paths("a", "c", edge_types=["link", "other"]) == [["a", "b", "c"]]
+        assert hb.paths("a", "missing") == []
+
 
 class TestStats:
     def test_stats(self):
@@ -217,6 +279,13 @@ class TestProvenanceQueries:
         assert len(edges) == 1
         assert edges[0].source == "hospital_system"
 
+    def test_edges_filter_by_source_keeps_insertion_order(self, hb):
+        ids = [f"e{i}" for i in range(6)]
+        for i, edge_id in enumerate(ids):
+            hb.edge([f"n{i}", f"n{i + 1}"], type="t", id=edge_id, source="s1")
+        hb.edge(["n2", "n3"], type="t", id="e2", source="s1", confidence=0.5)
+        assert [e.id for e in hb.edges(source="s1")] == ids
+
     def test_edges_filter_by_source_no_match(self, populated_hb):
         edges = populated_hb.edges(source="nonexistent_source")
         assert edges == []
@@ -259,6 +328,17 @@ class TestProvenanceQueries:
     def test_sources_empty_graph(self, hb):
         assert hb.sources() == []
 
+    def test_sources_track_edge_changes(self, hb):
+        hb.edge(["a", "b"], type="t", id="e1", source="s1", confidence=0.5)
+        hb.edge(["b", "c"], type="t", id="e2", source="s1", confidence=1.0)
+        hb.edge(["b", "c"], type="t", id="e2", source="s2", confidence=0.8)
+        assert hb.sources() == [
+            {"source": "s1", "edge_count": 1, "avg_confidence": 0.5},
+            {"source": "s2", "edge_count": 1, "avg_confidence": 0.8},
+        ]
+        hb.delete_edge("e1")
+        assert [s["source"] for s in hb.sources()] == ["s2"]
+
 
 class TestPersistence:
     def test_persistence_roundtrip(self, tmp_db_path):
@@ -854,50 +934,10 @@ class TestSchemaMigration:
 
     def _create_v3_database(self, path: str) -> None:
         """Create a v3 schema database with test data."""
-        conn = sqlite3.connect(path)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.executescript("""
-            CREATE TABLE meta (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            );
-            CREATE TABLE nodes (
-                id TEXT NOT NULL,
-                namespace TEXT NOT NULL DEFAULT 'default',
-                type TEXT NOT NULL DEFAULT 'unknown',
-                properties TEXT NOT NULL DEFAULT '{}',
-                PRIMARY KEY (id, namespace)
-            );
-            CREATE TABLE edges (
-                id TEXT NOT NULL,
-                namespace TEXT NOT NULL DEFAULT 'default',
-                type TEXT NOT NULL,
-                source TEXT NOT NULL DEFAULT 'unknown',
-                confidence REAL NOT NULL DEFAULT 1.0,
-                properties TEXT NOT NULL DEFAULT '{}',
-                PRIMARY KEY (id, namespace)
-            );
-            CREATE TABLE incidences (
-                edge_id TEXT NOT NULL,
-                namespace TEXT NOT NULL DEFAULT 'default',
-                node_id TEXT NOT NULL,
-                position INTEGER NOT NULL,
-                direction TEXT,
-                properties TEXT NOT NULL DEFAULT '{}',
-                PRIMARY KEY (edge_id, namespace, position),
-                FOREIGN KEY (edge_id, namespace)
-                    REFERENCES edges(id, namespace) ON DELETE CASCADE
-            );
-            CREATE TABLE vertex_set_index (
-                vertex_set_hash TEXT NOT NULL,
-                edge_id TEXT NOT NULL,
-                namespace TEXT NOT NULL DEFAULT 'default',
-                PRIMARY KEY (vertex_set_hash, edge_id, namespace),
-                FOREIGN KEY (edge_id, namespace)
-                    REFERENCES edges(id, namespace) ON DELETE CASCADE
-            );
-        """)
+        conn = sqlite3.connect(f"file:{path}?mode=rwc", uri=True, isolation_level=None)
+        conn.executescript("PRAGMA journal_mode=WAL; PRAGMA foreign_keys=OFF;")
+        conn.executescript(V3_SCHEMA_STRICT)
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', '3')")
         # Add test data
         conn.execute(
@@ -923,7 +963,7 @@ class TestSchemaMigration:
             " VALUES (?, ?, ?, ?, ?, ?)",
             ("e1", "default", "bob", 1, None, "{}"),
         )
-        conn.commit()
+        conn.execute("COMMIT")
         conn.close()
 
     def test_schema_v3_to_v4_migration(self, tmp_db_path):
@@ -955,43 +995,11 @@ class TestSchemaMigration:
     def test_schema_v3_migration_rejects_null_node_id(self, tmp_db_path):
         """v3 database with NULL node_id raises ValueError during migration."""
         # Create a v3 database with a permissive incidences schema (nullable node_id)
-        conn = sqlite3.connect(tmp_db_path)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=OFF")  # Allow corrupt data
-        conn.executescript("""
-            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
-            CREATE TABLE nodes (
-                id TEXT NOT NULL,
-                namespace TEXT NOT NULL DEFAULT 'default',
-                type TEXT NOT NULL DEFAULT 'unknown',
-                properties TEXT NOT NULL DEFAULT '{}',
-                PRIMARY KEY (id, namespace)
-            );
-            CREATE TABLE edges (
-                id TEXT NOT NULL,
-                namespace TEXT NOT NULL DEFAULT 'default',
-                type TEXT NOT NULL,
-                source TEXT NOT NULL DEFAULT 'unknown',
-                confidence REAL NOT NULL DEFAULT 1.0,
-                properties TEXT NOT NULL DEFAULT '{}',
-                PRIMARY KEY (id, namespace)
-            );
-            CREATE TABLE incidences (
-                edge_id TEXT NOT NULL,
-                namespace TEXT NOT NULL DEFAULT 'default',
-                node_id TEXT,
-                position INTEGER NOT NULL,
-                direction TEXT,
-                properties TEXT NOT NULL DEFAULT '{}',
-                PRIMARY KEY (edge_id, namespace, position)
-            );
-            CREATE TABLE vertex_set_index (
-                vertex_set_hash TEXT NOT NULL,
-                edge_id TEXT NOT NULL,
-                namespace TEXT NOT NULL DEFAULT 'default',
-                PRIMARY KEY (vertex_set_hash, edge_id, namespace)
-            );
-        """)
+        conn = sqlite3.connect(f"file:{tmp_db_path}?mode=rwc", uri=True, isolation_level=None)
+        # Allow corrupt data
+        conn.executescript("PRAGMA journal_mode=WAL; PRAGMA foreign_keys=OFF;")
+        conn.executescript(V3_SCHEMA_NULLABLE)
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', '3')")
         conn.execute(
             "INSERT INTO edges (id, namespace, type) VALUES (?, ?, ?)",
@@ -1002,30 +1010,27 @@ class TestSchemaMigration:
             " VALUES (?, ?, NULL, ?)",
             ("e_bad", "default", 0),
         )
-        conn.commit()
+        conn.execute("COMMIT")
         conn.close()
 
         with pytest.raises(ValueError, match="NULL node_id"):
             SQLiteStorage(tmp_db_path)
 
-    def test_schema_unknown_version_raises(self, tmp_db_path):
-        """Database with unsupported schema version raises ValueError."""
-        conn = sqlite3.connect(tmp_db_path)
-        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
-        conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', '99')")
-        conn.commit()
-        conn.close()
-
-        with pytest.raises(ValueError, match="Unsupported schema version '99'"):
-            SQLiteStorage(tmp_db_path)
-
-    def test_schema_missing_version_key_raises(self, tmp_db_path):
-        """Database with meta table but no schema_version key raises ValueError."""
-        conn = sqlite3.connect(tmp_db_path)
+    @pytest.mark.parametrize(
+        ("meta_row", "match"),
+        [
+            (("schema_version", "99"), "Unsupported schema version '99'"),
+            (("other_key", "whatever"), "no schema_version key"),
+        ],
+        ids=["unknown_version", "missing_version_key"],
+    )
+    def test_schema_validation_rejects(self, tmp_db_path, meta_row, match):
+        """Database with an unsupported or missing schema version raises ValueError."""
+        conn = sqlite3.connect(f"file:{tmp_db_path}?mode=rwc", uri=True, isolation_level=None)
         conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
-        conn.execute("INSERT INTO meta (key, value) VALUES ('other_key', 'whatever')")
+        conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", meta_row)
         conn.commit()
         conn.close()
 
-        with pytest.raises(ValueError, match="no schema_version key"):
+        with pytest.raises(ValueError, match=match):
             SQLiteStorage(tmp_db_path)
@@ -1,5 +1,8 @@
 """Tests for Cog-RAG support methods in HypergraphStore."""
 
+import copy
+import functools
+
 import pytest
 
 from hypabase.engine.core import (
@@ -9,6 +12,106 @@ from hypabase.engine.core import (
     Node,
 )
 
+# Topology specs: (nodes, edges) where each node is (id, type[, props]) and
+# each edge is (id, type, node_ids[, props]). Props are tuples of (key, value)
+# pairs so specs stay hashable and can key the build cache.
+
+INCIDENT_EDGES_SPEC = (
+    (("A", "entity"), ("B", "entity"), ("C", "entity"), ("D", "entity")),
+    (
+        ("e1", "relation", ("A", "B")),
+        ("e2", "relation", ("A", "C")),
+        ("e3", "theme", ("A", "B", "C")),
+        ("e4", "relation", ("B", "D")),
+    ),
+)
+
+NODE_TUPLES_SPEC = (
+    (("A", "entity"), ("B", "entity"), ("C", "entity"), ("D", "entity"), ("E", "entity")),
+    (
+        ("e1", "low", ("A", "B")),
+        ("e2", "low", ("A", "C")),
+        ("e3", "high", ("A", "B", "C")),
+        ("e4", "low", ("D", "E")),
+    ),
+)
+
+# A is in 3 edges, B in 2, C in 2, D in 1
+DEGREE_SPEC = (
+    (("A", "entity"), ("B", "entity"), ("C", "entity"), ("D", "entity")),
+    (
+        ("e1", "rel", ("A", "B")),
+        ("e2", "rel", ("A", "C")),
+        ("e3", "rel", ("A", "B")),
+        ("e4", "other", ("C", "D")),
+    ),
+)
+
+COGRAG_SPEC = (
+    (
+        ("JOHN", "person", (("description", "Main character"),)),
+        ("ACME_CORP", "organization", (("description", "Company"),)),
+        ("NEW_YORK", "location", (("description", "City"),)),
+        ("PROJECT_X", "event", (("description", "Secret project"),)),
+    ),
+    (
+        # Low-order relations (pairwise)
+        (
+            "rel1",
+            "low_order",
+            ("JOHN", "ACME_CORP"),
+            (("description", "works at"), ("keywords", "employment")),
+        ),
+        (
+            "rel2",
+            "low_order",
+            ("JOHN", "NEW_YORK"),
+            (("description", "lives in"), ("keywords", "residence")),
+        ),
+        # High-order relation (3+ entities)
+        (
+            "rel3",
+            "high_order",
+            ("JOHN", "ACME_CORP", "PROJECT_X"),
+            (("description", "leads project at company"), ("keywords", "leadership")),
+        ),
+    ),
+)
+
+# Vertex sets asserted against get_edge_node_tuples_of_node() results
+_AB = frozenset({"A", "B"})
+_AC = frozenset({"A", "C"})
+_ABC = frozenset({"A", "B", "C"})
+_DE = frozenset({"D", "E"})
+
+
+@functools.cache
+def _build_template(spec: tuple) -> HypergraphStore:
+    """Build a store from a topology spec once per distinct spec."""
+    nodes, edges = spec
+    s = HypergraphStore()
+    for nid, ntype, *props in nodes:
+        s.add_node(Node(nid, ntype, dict(props[0]) if props else {}))
+    for eid, etype, node_ids, *props in edges:
+        s.add_edge(
+            Hyperedge(
+                eid,
+                etype,
+                [Incidence(nid) for nid in node_ids],
+                properties=dict(props[0]) if props else {},
+            )
+        )
+    return s
+
+
+def build_store(spec: tuple) -> HypergraphStore:
+    """Return an independent store for a topology spec.
+
+    The cached template is deep-copied so tests that mutate the store
+    never leak state into other tests sharing the same spec.
+    """
+    return copy.deepcopy(_build_template(spec))
+
 
 class TestHasNode:
     """Tests for has_node() method."""
@@ -57,21 +160,12 @@ class TestGetEdgesOfNode:
     @pytest.fixture
     def store(self) -> HypergraphStore:
         """Store with nodes and multiple edge types."""
-        s = HypergraphStore()
-        for nid in ["A", "B", "C", "D"]:
-            s.add_node(Node(nid, "entity"))
-        s.add_edge(Hyperedge("e1", "relation", [Incidence("A"), Incidence("B")]))
-        s.add_edge(Hyperedge("e2", "relation", [Incidence("A"), Incidence("C")]))
-        s.add_edge(Hyperedge("e3", "theme", [Incidence("A"), Incidence("B"), Incidence("C")]))
-        s.add_edge(Hyperedge("e4", "relation", [Incidence("B"), Incidence("D")]))
-        return s
+        return build_store(INCIDENT_EDGES_SPEC)
 
     def test_returns_all_incident_edges(self, store):
         """Returns all edges containing the node."""
         edges = store.get_edges_of_node("A")
-        assert len(edges) == 3
-        edge_ids = {e.id for e in edges}
-        assert edge_ids == {"e1", "e2", "e3"}
+        assert sorted(e.id for e in edges) == ["e1", "e2", "e3"]
 
     def test_node_in_single_edge(self, store):
         """Node in single edge returns that edge."""
@@ -82,14 +176,12 @@ class TestGetEdgesOfNode:
     def test_filter_by_edge_type(self, store):
         """Filter edges by type."""
         edges = store.get_edges_of_node("A", edge_types=["relation"])
-        assert len(edges) == 2
-        edge_ids = {e.id for e in edges}
-        assert edge_ids == {"e1", "e2"}
+        assert sorted(e.id for e in edges) == ["e1", "e2"]
 
     def test_filter_by_multiple_types(self, store):
         """Filter by multiple edge types."""
         edges = store.get_edges_of_node("A", edge_types=["relation", "theme"])
-        assert len(edges) == 3
+        assert sorted(e.id for e in edges) == ["e1", "e2", "e3"]
 
     def test_filter_by_nonexistent_type(self, store):
         """Filter by non-existent type returns empty."""
@@ -139,14 +231,7 @@ class TestGetEdgeNodeTuplesOfNode:
     @pytest.fixture
     def store(self) -> HypergraphStore:
         """Store with various edge configurations."""
-        s = HypergraphStore()
-        for nid in ["A", "B", "C", "D", "E"]:
-            s.add_node(Node(nid, "entity"))
-        s.add_edge(Hyperedge("e1", "low", [Incidence("A"), Incidence("B")]))
-        s.add_edge(Hyperedge("e2", "low", [Incidence("A"), Incidence("C")]))
-        s.add_edge(Hyperedge("e3", "high", [Incidence("A"), Incidence("B"), Incidence("C")]))
-        s.add_edge(Hyperedge("e4", "low", [Incidence("D"), Incidence("E")]))
-        return s
+        return build_store(NODE_TUPLES_SPEC)
 
     def test_returns_frozensets(self, store):
         """Returns set of frozensets."""
@@ -158,16 +243,16 @@ class TestGetEdgeNodeTuplesOfNode:
         """Returns correct vertex sets for incident edges."""
         tuples = store.get_edge_node_tuples_of_node("A")
         assert len(tuples) == 3
-        assert frozenset({"A", "B"}) in tuples
-        assert frozenset({"A", "C"}) in tuples
-        assert frozenset({"A", "B", "C"}) in tuples
+        assert _AB in tuples
+        assert _AC in tuples
+        assert _ABC in tuples
 
     def test_filter_by_edge_type(self, store):
         """Filter by edge type."""
         tuples = store.get_edge_node_tuples_of_node("A", edge_types=["low"])
         assert len(tuples) == 2
-        assert frozenset({"A", "B"}) in tuples
-        assert frozenset({"A", "C"}) in tuples
+        assert _AB in tuples
+        assert _AC in tuples
 
     def test_isolated_node_returns_empty_set(self):
         """Isolated node returns empty set."""
@@ -185,7 +270,7 @@ class TestGetEdgeNodeTuplesOfNode:
     def test_node_in_single_edge(self, store):
         """Node in single edge returns single frozenset."""
         tuples = store.get_edge_node_tuples_of_node("D")
-        assert tuples == {frozenset({"D", "E"})}
+        assert tuples == {_DE}
 
     def test_duplicate_vertex_sets_deduplicated(self):
         """Multiple edges with same vertex set appear once."""
@@ -197,7 +282,7 @@ class TestGetEdgeNodeTuplesOfNode:
         store.add_edge(Hyperedge("e2", "type2", [Incidence("A"), Incidence("B")]))
         tuples = store.get_edge_node_tuples_of_node("A")
         # frozenset deduplicates automatically
-        assert tuples == {frozenset({"A", "B"})}
+        assert tuples == {_AB}
 
 
 class TestHyperedgeDegree:
@@ -206,43 +291,47 @@ class TestHyperedgeDegree:
     @pytest.fixture
     def store(self) -> HypergraphStore:
         """Store with nodes of varying degrees."""
-        s = HypergraphStore()
-        # Create nodes
-        for nid in ["A", "B", "C", "D"]:
-            s.add_node(Node(nid, "entity"))
-        # A is in 3 edges, B in 2, C in 1, D in 1
-        s.add_edge(Hyperedge("e1", "rel", [Incidence("A"), Incidence("B")]))
-        s.add_edge(Hyperedge("e2", "rel", [Incidence("A"), Incidence("C")]))
-        s.add_edge(Hyperedge("e3", "rel", [Incidence("A"), Incidence("B")]))
-        s.add_edge(Hyperedge("e4", "other", [Incidence("C"), Incidence("D")]))
-        return s
-
-    def test_sum_of_vertex_degrees(self, store):
+        return build_store(DEGREE_SPEC)
+
+    @pytest.fixture
+    def degrees(self, store) -> dict[str, int]:
+        """Per-vertex degrees for the fixture universe, computed in one pass."""
+        return store.vertex_degrees({"A", "B", "C", "D"})
+
+    def test_vertex_degrees(self, degrees):
+        """vertex_degrees returns each node's edge count."""
+        assert degrees == {"A": 3, "B": 2, "C": 2, "D": 1}
+
+    def test_vertex_degrees_unknown_node(self, store):
+        """Unknown nodes have degree 0."""
+        assert store.vertex_degrees({"A", "X"}) == {"A": 3, "X": 0}
+
+    def test_sum_of_vertex_degrees(self, store, degrees):
         """Returns sum of degrees of participating vertices."""
         # e1 has {A, B}: degree(A)=3, degree(B)=2 → 5
         degree = store.hyperedge_degree({"A", "B"}, edge_type="rel")
-        assert degree == 5
+        assert degree == degrees["A"] + degrees["B"] == 5
 
     def test_nonexistent_edge_returns_zero(self, store):
         """Non-existent edge returns 0."""
         degree = store.hyperedge_degree({"X", "Y"})
         assert degree == 0
 
-    def test_filter_by_type(self, store):
+    def test_filter_by_type(self, store, degrees):
         """Filter by edge type."""
         # {C, D} exists only as "other" type
         # C is in e2 (rel) and e4 (other), so degree(C)=2
         # D is in e4 only, so degree(D)=1
         degree = store.hyperedge_degree({"C", "D"}, edge_type="other")
-        assert degree == 3  # degree(C)=2, degree(D)=1
+        assert degree == degrees["C"] + degrees["D"] == 3
 
         degree = store.hyperedge_degree({"C", "D"}, edge_type="rel")
         assert degree == 0  # No "rel" edge with {C, D}
 
-    def test_without_type_filter(self, store):
+    def test_without_type_filter(self, store, degrees):
         """Without type filter, finds any matching edge."""
         degree = store.hyperedge_degree({"C", "D"})
-        assert degree == 3  # degree(C)=2, degree(D)=1
+        assert degree == degrees["C"] + degrees["D"] == 3
 
     def test_single_node_edge(self):
         """Single-node edge degree equals that node's degree."""
@@ -278,44 +367,7 @@ class TestCogRAGIntegration:
     @pytest.fixture
     def cograg_store(self) -> HypergraphStore:
         """Store mimicking Cog-RAG entity hypergraph."""
-        s = HypergraphStore()
-        # Entities from document extraction
-        entities = [
-            ("JOHN", "person", {"description": "Main character"}),
-            ("ACME_CORP", "organization", {"description": "Company"}),
-            ("NEW_YORK", "location", {"description": "City"}),
-            ("PROJECT_X", "event", {"description": "Secret project"}),
-        ]
-        for eid, etype, props in entities:
-            s.add_node(Node(eid, etype, props))
-
-        # Low-order relations (pairwise)
-        s.add_edge(
-            Hyperedge(
-                "rel1",
-                "low_order",
-                [Incidence("JOHN"), Incidence("ACME_CORP")],
-                properties={"description": "works at", "keywords": "employment"},
-            )
-        )
-        s.add_edge(
-            Hyperedge(
-                "rel2",
-                "low_order",
-                [Incidence("JOHN"), Incidence("NEW_YORK")],
-                properties={"description": "lives in", "keywords": "residence"},
-            )
-        )
-        # High-order relation (3+ entities)
-        s.add_edge(
-            Hyperedge(
-                "rel3",
-                "high_order",
-                [Incidence("JOHN"), Incidence("ACME_CORP"), Incidence("PROJECT_X")],
-                properties={"description": "leads project at company", "keywords": "leadership"},
-            )
-        )
-        return s
+        return build_store(COGRAG_SPEC)
 
     def test_diffusion_from_entity(self, cograg_store):
         """Simulate Cog-RAG diffusion: get neighboring edges then their vertices."""
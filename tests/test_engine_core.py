@@ -1,10 +1,17 @@
 """Tests for core hypergraph data structures and operations."""
 
 import copy
+import dataclasses
 import json
+import pickle
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
 
 import pytest
 
+import hypabase.engine.core as core_module
 from hypabase.engine.core import (
     Hyperedge,
     HypergraphStore,
@@ -31,6 +38,23 @@ class TestNode:
         assert node.properties["data_type"] == "INTEGER"
         assert node.properties["primary_key"] is True
 
+    def test_node_is_immutable(self):
+        node = Node(id="customers", type="table")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            node.type = "view"
+        assert not hasattr(node, "__dict__")
+
+    def test_node_hashes_by_id(self):
+        node = Node(id="customers", type="table", properties={"rows": [1, 2]})
+        assert hash(node) == hash("customers")
+        assert node in {Node(id="customers", type="table", properties={"rows": [1, 2]})}
+
+    def test_identifiers_are_interned(self):
+        runtime_id = "".join(["custom", "ers"])
+        node = Node(id=runtime_id, type="table")
+        inc = Incidence(node_id="".join(["custom", "ers"]))
+        assert node.id is inc.node_id
+
 
 class TestIncidence:
     """Tests for Incidence dataclass."""
@@ -52,6 +76,12 @@ class TestIncidence:
     def test_invalid_direction_raises(self):
         with pytest.raises(ValueError, match="direction must be"):
             Incidence(node_id="x", direction="invalid")
+        with pytest.raises(ValueError, match="direction must be"):
+            Incidence(node_id="x", direction=["head"])
+
+    def test_direction_is_canonicalized(self):
+        inc = Incidence(node_id="x", direction="".join(["he", "ad"]))
+        assert inc.direction is Incidence(node_id="y", direction="head").direction
 
     def test_incidence_with_properties(self):
         inc = Incidence(
@@ -60,6 +90,12 @@ class TestIncidence:
         )
         assert inc.properties["role"] == "measure"
 
+    def test_incidence_is_immutable(self):
+        inc = Incidence(node_id="customers.id")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            inc.direction = "head"
+        assert not hasattr(inc, "__dict__")
+
 
 class TestHyperedge:
     """Tests for Hyperedge dataclass."""
@@ -95,6 +131,18 @@ class TestHyperedge:
         assert edge.head_nodes == ["customers.id"]
         assert edge.nodes == ["orders.customer_id", "customers.id"]
 
+    def test_traversal_sets_precomputed(self):
+        undirected = Hyperedge(id="e1", type="t", incidences=[Incidence("a"), Incidence("b")])
+        assert undirected._head_set is undirected.node_set
+        assert undirected._tail_set is undirected.node_set
+        directed = Hyperedge(
+            id="e2",
+            type="t",
+            incidences=[Incidence("a", direction="tail"), Incidence("b", direction="head")],
+        )
+        assert directed._head_set == {"b"}
+        assert directed._tail_set == {"a"}
+
     def test_edge_with_provenance(self):
         edge = Hyperedge(
             id="e1",
@@ -106,6 +154,57 @@ class TestHyperedge:
         assert edge.source == "schema"
         assert edge.confidence == 0.95
 
+    def test_edge_has_no_instance_dict(self):
+        edge = Hyperedge(id="e1", type="test", incidences=[Incidence("a")])
+        assert not hasattr(edge, "__dict__")
+        assert "_node_set" in core_module._HyperedgeViews.__slots__
+
+    def test_derived_views_are_not_fields(self):
+        edge = Hyperedge(id="e1", type="test", incidences=[Incidence("a", direction="head")])
+        assert [f.name for f in dataclasses.fields(edge)] == [
+            "id",
+            "type",
+            "incidences",
+            "properties",
+            "source",
+            "confidence",
+        ]
+        assert set(dataclasses.asdict(edge)) == {
+            "id",
+            "type",
+            "incidences",
+            "properties",
+            "source",
+            "confidence",
+        }
+        assert dataclasses.asdict(edge.incidences[0]) == {
+            "node_id": "a",
+            "edge_ref_id": None,
+            "direction": "head",
+            "properties": {},
+        }
+        replaced = dataclasses.replace(edge, incidences=[Incidence("b", direction="tail")])
+        assert replaced.tail_nodes == ["b"]
+        assert replaced.head_nodes == []
+
+    def test_records_are_hashable(self):
+        inc = Incidence(node_id="a", direction="head", properties={"role": ["fk"]})
+        edge = Hyperedge(id="e1", type="test", incidences=[inc], properties={"tags": []})
+        same = Incidence(node_id="a", direction="head", properties={"role": ["fk"]})
+        assert len({inc, same}) == 1
+        assert hash(Incidence(node_id="a")) != hash(Incidence(edge_ref_id="a"))
+        assert hash(edge) == hash("e1")
+
+    def test_edge_strings_are_interned(self):
+        a = Hyperedge(
+            id="e1", type="".join(["fk", "_ref"]), incidences=[], source="".join(["sch", "ema"])
+        )
+        b = Hyperedge(
+            id="e2", type="".join(["fk_", "ref"]), incidences=[], source="".join(["sche", "ma"])
+        )
+        assert a.type is b.type
+        assert a.source is b.source
+
     def test_invalid_confidence_raises(self):
         with pytest.raises(ValueError, match="confidence must be"):
             Hyperedge(id="e1", type="test", incidences=[], confidence=1.5)
@@ -120,6 +219,32 @@ class TestHyperedge:
         assert edge.properties["aggregation"] == "sum"
         assert edge.properties["sql_template"] == "SUM(orders.amount)"
 
+    def test_derived_views_cached_at_construction(self):
+        edge = Hyperedge(
+            id="e1",
+            type="test",
+            incidences=[
+                Incidence("a", direction="tail"),
+                Incidence("b", direction="head"),
+                Incidence(edge_ref_id="e0"),
+            ],
+        )
+        assert isinstance(edge.node_set, frozenset)
+        assert edge.node_set is edge.node_set
+        # List views are fresh copies, so callers cannot corrupt the cache
+        edge.nodes.append("x")
+        assert edge.nodes == ["a", "b"]
+        assert edge.edge_refs == ["e0"]
+
+    def test_incidences_stored_as_tuple(self):
+        incidences = [Incidence("a"), Incidence("b")]
+        edge = Hyperedge(id="e1", type="test", incidences=incidences)
+        assert isinstance(edge.incidences, tuple)
+        # The caller's list is copied, so changing it cannot desync node_set
+        incidences.append(Incidence("c"))
+        assert len(edge.incidences) == 2
+        assert edge.node_set == {"a", "b"}
+
 
 class TestHypergraphStore:
     """Tests for HypergraphStore operations."""
@@ -194,6 +319,37 @@ class TestHypergraphStore:
         column_ids = {c.id for c in columns}
         assert column_ids == {"customers.id", "customers.name"}
 
+    def test_find_nodes_tracks_mutations(self, store: HypergraphStore):
+        assert len(store.find_nodes(table="orders")) == 3
+        store.upsert_node(Node("orders.amount", "column", {"table": "payments"}))
+        store.delete_node("orders.id")
+        store.add_node(Node("payments.id", "column", {"table": "payments"}))
+        assert {n.id for n in store.find_nodes(table="orders")} == {"orders.customer_id"}
+        payments = store.find_nodes(table="payments", data_type="DECIMAL")
+        assert [n.id for n in payments] == ["orders.amount"]
+
+    def test_find_nodes_none_value_with_other_keys(self, store: HypergraphStore):
+        columns = store.find_nodes(table="customers", nullable=None)
+        assert {c.id for c in columns} == {"customers.id", "customers.name"}
+        assert store.find_nodes(table="customers", tags=["pii"]) == []
+        assert len(store.find_nodes(nullable=None)) == 9
+        store.upsert_node(Node("customers.id", "column", {"nullable": False}))
+        columns = store.find_nodes(table="customers", nullable=None)
+        assert [c.id for c in columns] == ["customers.name"]
+
+    def test_find_nodes_sees_in_place_property_changes(self, store: HypergraphStore):
+        assert len(store.find_nodes(table="customers")) == 2
+        node = store.get_node("customers.id")
+        assert node is not None
+        node.properties["table"] = "accounts"
+        assert [n.id for n in store.find_nodes(table="accounts")] == ["customers.id"]
+        assert [n.id for n in store.find_nodes(table="customers")] == ["customers.name"]
+
+    def test_find_nodes_unhashable_property_value(self, store: HypergraphStore):
+        store.add_node(Node("tagged", "column", {"tags": {"pii"}}))
+        assert [n.id for n in store.find_nodes(tags=frozenset({"pii"}))] == ["tagged"]
+        assert [n.id for n in store.find_nodes(tags={"pii"})] == ["tagged"]
+
     def test_delete_node(self, store: HypergraphStore):
         assert store.delete_node("products") is True
         assert store.get_node("products") is None
@@ -223,6 +379,22 @@ class TestHypergraphStore:
         assert len(fks) == 1
         assert fks[0].id == "fk_orders_customers"
 
+    def test_get_edges_by_source(self, store: HypergraphStore):
+        edge = store.get_edge("fk_orders_customers")
+        assert edge is not None
+        assert edge in store.get_edges_by_source(edge.source)
+
+        store.upsert_edge(
+            Hyperedge(edge.id, edge.type, edge.incidences, source="manual_review", confidence=0.5)
+        )
+        assert [e.id for e in store.get_edges_by_source("manual_review")] == [edge.id]
+        assert edge.id not in {e.id for e in store.get_edges_by_source(edge.source)}
+
+        store.delete_edge(edge.id)
+        assert store.get_edges_by_source("manual_review") == []
+        assert "manual_review" not in store._edges_by_source
+        assert store.validate()["valid"] is True
+
     def test_get_edges_containing_any(self, store: HypergraphStore):
         edges = store.get_edges_containing({"orders.amount"}, match_all=False)
         assert len(edges) == 1
@@ -250,6 +422,29 @@ class TestHypergraphStore:
         assert len(edges) == 1
         assert edges[0].id == "revenue_mapping"
 
+    def test_find_edges_tracks_mutations(self, store: HypergraphStore):
+        assert len(store.find_edges(aggregation="sum")) == 1
+        store.upsert_edge(
+            Hyperedge(
+                id="revenue_mapping",
+                type="concept_mapping",
+                incidences=[Incidence("revenue"), Incidence("orders.amount")],
+                properties={"aggregation": "avg"},
+            )
+        )
+        assert store.find_edges(aggregation="sum") == []
+        assert [e.id for e in store.find_edges(aggregation="avg")] == ["revenue_mapping"]
+        store.delete_edge("revenue_mapping")
+        assert store.find_edges(aggregation="avg") == []
+
+    def test_find_edges_sees_in_place_property_changes(self, store: HypergraphStore):
+        assert len(store.find_edges(aggregation="sum")) == 1
+        edge = store.get_edge("revenue_mapping")
+        assert edge is not None
+        edge.properties["aggregation"] = "avg"
+        assert store.find_edges(aggregation="sum") == []
+        assert [e.id for e in store.find_edges(aggregation="avg")] == ["revenue_mapping"]
+
     def test_delete_edge(self, store: HypergraphStore):
         assert store.delete_edge("revenue_mapping") is True
         assert store.get_edge("revenue_mapping") is None
@@ -260,6 +455,13 @@ class TestHypergraphStore:
     def test_delete_nonexistent_edge(self, store: HypergraphStore):
         assert store.delete_edge("nonexistent") is False
 
+    def test_validate_reports_deleted_node(self, store: HypergraphStore):
+        assert store.validate()["valid"] is True
+        store.delete_node("revenue")
+        result = store.validate()
+        assert result["orphaned_edges"] == ["revenue_mapping"]
+        assert "references non-existent nodes: ['revenue']" in result["errors"][0]
+
     def test_get_all_edges(self, store: HypergraphStore):
         edges = store.get_all_edges()
         assert len(edges) == 2
@@ -276,6 +478,26 @@ class TestHypergraphStore:
         assert stats["edges_by_type"]["foreign_key"] == 1
         assert stats["edges_by_type"]["concept_mapping"] == 1
 
+    def test_counts(self, store: HypergraphStore):
+        assert store.counts() == (9, 2)
+
+    def test_bulk_add_matches_incremental_adds(self, store: HypergraphStore):
+        bulk = HypergraphStore.from_iter(store.get_all_nodes(), store.get_all_edges())
+        assert bulk.stats() == store.stats()
+        assert bulk._node_to_edges == store._node_to_edges
+        assert bulk._edges_by_node_set == store._edges_by_node_set
+        assert bulk._nodes_by_type == store._nodes_by_type
+
+    def test_bulk_add_reindexes_overwrites(self, store: HypergraphStore):
+        store.bulk_add(
+            nodes=[Node("products", "view")],
+            edges=[Hyperedge("revenue_mapping", "other", [Incidence("revenue")])],
+        )
+        assert [n.id for n in store.get_nodes_by_type("view")] == ["products"]
+        assert store.get_edges_by_type("concept_mapping") == []
+        assert store.get_edges_containing({"orders.amount"}) == []
+        assert store.validate()["valid"] is True
+
 
 class TestPathFinding:
     """Tests for path finding with intersection constraints."""
@@ -429,6 +651,46 @@ class TestPathFinding:
         # Should not find a path since edges only share 1 node (orders)
         assert len(paths) == 0
 
+    def test_min_intersection_satisfied(self, store: HypergraphStore):
+        """Edges sharing enough nodes are adjacent under a higher IS."""
+        store.add_edge(
+            Hyperedge(
+                "orders_bridge",
+                "other",
+                [Incidence("orders"), Incidence("orders.customer_id"), Incidence("products")],
+            )
+        )
+        paths = store.find_paths(
+            start_nodes={"products"},
+            end_nodes={"customers"},
+            min_intersection=2,
+            edge_types=["other", "foreign_key"],
+        )
+        assert [[e.id for e in p] for p in paths] == [["orders_bridge", "fk_orders_customers"]]
+        neighbors = store._edge_neighbors(store.get_edge("orders_bridge"))
+        assert neighbors["fk_orders_customers"] == 2
+
+    def test_repeated_query_served_from_cache(self, store: HypergraphStore):
+        """Identical queries reuse the memoized result without sharing lists."""
+        first = store.find_paths(start_nodes={"order_items"}, end_nodes={"customers"})
+        first[0].append(first[0][0])
+        second = store.find_paths(start_nodes={"order_items"}, end_nodes={"customers"})
+        assert [e.id for e in second[0]] == ["fk_order_items_orders", "fk_orders_customers"]
+        assert len(store._path_cache) == 1
+
+    def test_cache_invalidated_by_edge_mutation(self, store: HypergraphStore):
+        """Adding or deleting an edge invalidates memoized paths."""
+        assert store.find_paths(start_nodes={"products"}, end_nodes={"customers"}, max_hops=1) == []
+
+        store.add_edge(
+            Hyperedge("shortcut", "other", [Incidence("products"), Incidence("customers")])
+        )
+        paths = store.find_paths(start_nodes={"products"}, end_nodes={"customers"}, max_hops=1)
+        assert [[e.id for e in p] for p in paths] == [["shortcut"]]
+
+        store.delete_edge("shortcut")
+        assert store.find_paths(start_nodes={"products"}, end_nodes={"customers"}, max_hops=1) == []
+
 
 class TestSerialization:
     """Tests for hypergraph serialization."""
@@ -516,6 +778,64 @@ class TestSerialization:
         parsed = json.loads(json_str)
         assert parsed == data
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_json_bytes_match_dict_output(
+        self, store: HypergraphStore, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ):
+        """to_hif_json()/to_dict_json() decode to the same structures with either encoder."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(core_module, "_HAS_ORJSON", use_orjson)
+        assert json.loads(store.to_hif_json()) == store.to_hif()
+        assert json.loads(store.to_dict_json(indent=True)) == store.to_dict()
+        restored = HypergraphStore.from_dict_json(store.to_dict_json())
+        assert restored.to_dict() == store.to_dict()
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_dumps_json_is_lossless(self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+        """NaN, infinities and integers beyond 64 bits encode as the stdlib writes them."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(core_module, "_HAS_ORJSON", use_orjson)
+        store = HypergraphStore()
+        store.add_node(Node("a", "t", {"nan": float("nan"), "inf": [float("-inf")], "big": 2**64}))
+        props = json.loads(store.to_dict_json())["nodes"][0]["properties"]
+        assert props["nan"] != props["nan"]
+        assert props["inf"] == [float("-inf")]
+        assert props["big"] == 2**64
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    @pytest.mark.parametrize(
+        "value",
+        [datetime(2026, 1, 1), uuid.UUID(int=1), Decimal("1.5")],
+        ids=["datetime", "uuid", "decimal"],
+    )
+    def test_dumps_json_rejects_non_json_values(
+        self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool, value: Any
+    ):
+        """Values the stdlib encoder rejects raise TypeError with or without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(core_module, "_HAS_ORJSON", use_orjson)
+        store = HypergraphStore()
+        store.add_node(Node("a", "t", {"when": [value]}))
+        with pytest.raises(TypeError):
+            store.to_dict_json()
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_loads_json_accepts_stdlib_output(
+        self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ):
+        """_loads_json() parses what either encoder writes, including NaN literals."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(core_module, "_HAS_ORJSON", use_orjson)
+        assert core_module._loads_json(b'{"a": [1, "\xc3\xa9"]}') == {"a": [1, "\u00e9"]}
+        parsed = core_module._loads_json(json.dumps({"x": float("nan")}).encode())
+        assert parsed["x"] != parsed["x"]
+        with pytest.raises(json.JSONDecodeError):
+            core_module._loads_json(b"{not json")
+
 
 class TestMetagraphPrep:
     """Tests for metagraph foundation: edges referencing edges."""
@@ -631,6 +951,15 @@ class TestMetagraphPrep:
         store.delete_edge("e2")
         assert "e1" not in store._edge_to_edges  # cleaned up entirely
 
+    def test_get_edges_referencing(self):
+        """get_edges_referencing() reads the edge-to-edges index."""
+        store = HypergraphStore()
+        store.add_node(Node("A", "t"))
+        store.add_edge(Hyperedge("e1", "link", [Incidence(node_id="A")]))
+        store.add_edge(Hyperedge("e2", "meta", [Incidence(edge_ref_id="e1")]))
+        assert [e.id for e in store.get_edges_referencing("e1")] == ["e2"]
+        assert store.get_edges_referencing("e2") == []
+
     def test_validate_catches_missing_edge_ref(self):
         """validate() reports edges referencing non-existent edges."""
         store = HypergraphStore()
@@ -791,6 +1120,21 @@ class TestMetagraphPrep:
         assert "e1" not in store._edge_to_edges
         assert "e2" in store._edge_to_edges["e3"]
 
+    def test_delete_edge_with_repeated_ref(self):
+        """An edge referencing the same edge twice is fully unindexed on delete."""
+        store = HypergraphStore()
+        store.add_node(Node("A", "t"))
+        store.add_edge(Hyperedge("e1", "link", [Incidence(node_id="A")]))
+        store.add_edge(
+            Hyperedge(
+                id="e2", type="meta",
+                incidences=[Incidence(edge_ref_id="e1"), Incidence(edge_ref_id="e1")],
+            )
+        )
+        assert store.delete_edge("e2") is True
+        assert "e1" not in store._edge_to_edges
+        assert store.validate()["valid"] is True
+
     def test_deepcopy_with_edge_refs(self):
         """Deep copy preserves edge refs and mutating original doesn't affect copy."""
         store = HypergraphStore()
@@ -816,6 +1160,88 @@ class TestMetagraphPrep:
         assert clone.get_edge("e2").edge_refs == ["e1"]
         assert "e2" in clone._edge_to_edges["e1"]
 
+    def test_deepcopy_never_shares_property_dicts(self):
+        """Deep copy gives every record its own property dicts, even empty ones."""
+        store = HypergraphStore()
+        store.add_node(Node("A", "t"))
+        store.add_node(Node("B", "t", {"tags": ["x"]}))
+        store.add_edge(Hyperedge("e1", "link", [Incidence("A"), Incidence("B")]))
+        store.add_edge(Hyperedge("e2", "link", [Incidence("A", properties={"roles": ["src"]})]))
+        clone = copy.deepcopy(store)
+        assert clone.get_node("A") is not store.get_node("A")
+        assert clone.get_edge("e1") is not store.get_edge("e1")
+
+        clone.get_node("A").properties["x"] = 1
+        clone.get_edge("e1").properties["x"] = 1
+        clone.get_edge("e1").incidences[0].properties["x"] = 1
+        assert store.get_node("A").properties == {}
+        assert store.get_edge("e1").properties == {}
+        assert store.get_edge("e1").incidences[0].properties == {}
+
+        store.get_node("B").properties["tags"].append("y")
+        store.get_edge("e2").incidences[0].properties["roles"].append("dst")
+        assert clone.get_node("B").properties == {"tags": ["x"]}
+        assert clone.get_edge("e2").incidences[0].properties == {"roles": ["src"]}
+
+    def test_pickle_roundtrip_rebuilds_records(self):
+        """Records pickle by constructor arguments and rebuild derived views on load."""
+        store = HypergraphStore()
+        store.add_node(Node("A", "t", {"tags": ["x"]}))
+        store.add_node(Node("B", "t"))
+        store.add_edge(
+            Hyperedge(
+                id="e1", type="link",
+                incidences=[
+                    Incidence(node_id="A", direction="tail"),
+                    Incidence(node_id="B", direction="head", properties={"w": 1}),
+                ],
+                source="schema",
+                confidence=0.5,
+            )
+        )
+        store.add_edge(
+            Hyperedge(
+                id="e2", type="meta",
+                incidences=[Incidence(node_id="A"), Incidence(edge_ref_id="e1")],
+            )
+        )
+        loaded = pickle.loads(pickle.dumps(store, protocol=pickle.HIGHEST_PROTOCOL))
+        assert loaded.get_node("A") == store.get_node("A")
+        assert loaded.get_edge("e1") == store.get_edge("e1")
+        assert loaded.get_edge("e1").head_nodes == ["B"]
+        assert loaded.get_edge("e1").source == "schema"
+        assert loaded.get_edge("e2").edge_refs == ["e1"]
+        assert loaded.validate()["valid"] is True
+
+    def test_clone_with_edge_refs(self):
+        """clone() shares records but keeps indexes independent of the original."""
+        store = HypergraphStore()
+        store.add_node(Node("A", "t"))
+        store.add_node(Node("B", "t"))
+        store.add_edge(
+            Hyperedge(
+                id="e1", type="link",
+                incidences=[Incidence(node_id="A"), Incidence(node_id="B")],
+            )
+        )
+        store.add_edge(
+            Hyperedge(
+                id="e2", type="meta",
+                incidences=[Incidence(node_id="A"), Incidence(edge_ref_id="e1")],
+            )
+        )
+        clone = store.clone()
+        assert clone.get_edge("e2") is store.get_edge("e2")
+        # Mutate original
+        store.delete_edge("e2")
+        store.add_node(Node("C", "t"))
+        # Clone should still have e2 and its index entries
+        assert clone.get_edge("e2") is not None
+        assert "e2" in clone._edge_to_edges["e1"]
+        assert "e2" in clone._node_to_edges["A"]
+        assert clone.get_edges_by_type("meta")[0].id == "e2"
+        assert clone.get_node("C") is None
+
     def test_edge_ref_only_edge_vertex_set(self):
         """Edge with only edge-ref incidences has empty nodes/node_set
         and no vertex-set index entry."""
@@ -846,6 +1272,9 @@ class TestMetagraphPrep:
         assert e_meta.node_set == set()
         # Empty frozenset should NOT be in the vertex-set index
         assert frozenset() not in store._edges_by_node_set
+        # ...and shares the module-level empty set rather than allocating one
+        other_meta = Hyperedge("e_other", "meta", [Incidence(edge_ref_id="e1")])
+        assert e_meta.node_set is other_meta.node_set
 
     def test_delete_referenced_edge_cleans_index_key(self):
         """Deleting e1 that is referenced by e2 removes the 'e1' key from _edge_to_edges."""
@@ -868,6 +1297,9 @@ class TestMetagraphPrep:
         store.delete_edge("e1")
         # The key itself should be removed (not just empty)
         assert "e1" not in store._edge_to_edges
+        # Deleting the referencing edge afterwards must not recreate the key
+        store.delete_edge("e2")
+        assert "e1" not in store._edge_to_edges
 
     def test_hif_export_warning_metadata(self):
         """to_hif() sets _hypabase_edge_refs_omitted metadata when edge refs are skipped."""
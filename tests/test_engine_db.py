@@ -1,9 +1,12 @@
 """Tests for HypergraphDB namespacing."""
 
+import math
 import tempfile
+from pathlib import Path
 
 import pytest
 
+import hypabase.engine.core as core_module
 from hypabase.engine import (
     Hyperedge,
     HypergraphDB,
@@ -210,6 +213,19 @@ class TestNamespaceCRUD:
         assert db.store.get_node("A") is not None
         assert db.store.get_node("B") is None
 
+    def test_copy_does_not_share_empty_properties(self):
+        """Adding properties in the copy leaves the source's empty dict alone."""
+        db = HypergraphDB()
+        db.select("source")
+        db.store.add_node(Node("A", "test"))
+
+        db.copy_namespace("source", "target")
+
+        db.select("target")
+        db.store.get_node("A").properties["x"] = 1
+        db.select("source")
+        assert db.store.get_node("A").properties == {}
+
     def test_copy_creates_deep_copy(self):
         """Copied namespace has independent property objects (deep copy)."""
         db = HypergraphDB()
@@ -439,6 +455,69 @@ class TestSaveLoad:
         assert edge is not None
         assert edge.incidences[0].direction == "tail"
 
+    @pytest.mark.parametrize("format", ["json", "hif"])
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_save_load_non_finite_and_big_numbers(
+        self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool, format: str
+    ):
+        """NaN, infinities and integers beyond 64 bits survive save/load with either encoder."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(core_module, "_HAS_ORJSON", use_orjson)
+        props = {"score": float("nan"), "inf": float("inf"), "big": 2**64, "neg": -(2**70)}
+        db = HypergraphDB()
+        db.store.add_node(Node("A", "table", props))
+        db.store.add_edge(Hyperedge("e1", "fk", [Incidence("A")], properties={"w": -math.inf}))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db.save(tmpdir, format=format)
+            loaded = HypergraphDB.load(tmpdir)
+
+        restored = loaded.store.get_node("A").properties
+        assert math.isnan(restored["score"])
+        assert restored["inf"] == math.inf
+        assert restored["big"] == 2**64
+        assert restored["neg"] == -(2**70)
+        assert loaded.store.get_edge("e1").properties == {"w": -math.inf}
+
+    def test_save_load_msgpack_format(self):
+        """Save and load all namespaces through a single msgpack file."""
+        pytest.importorskip("msgpack")
+        db = HypergraphDB()
+        db.store.add_node(Node("A", "table", {"tags": ["x"], "rank": 1.5}))
+        db.select("financial/entities")
+        db.store.add_edge(Hyperedge("e1", "fk", [Incidence("A", direction="tail"), Incidence("B")]))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db.save(tmpdir, format="msgpack")
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                "manifest.json",
+                "namespaces.mpk",
+            ]
+            loaded = HypergraphDB.load(tmpdir)
+
+        assert loaded.store.get_node("A").properties == {"tags": ["x"], "rank": 1.5}
+        loaded.select("financial/entities")
+        edge = loaded.store.get_edge("e1")
+        assert edge.incidences[0].direction == "tail"
+        assert edge.nodes == ["A", "B"]
+
+    def test_failed_msgpack_save_keeps_existing_save(self):
+        """A msgpack save that cannot pack leaves the previous save loadable."""
+        pytest.importorskip("msgpack")
+        db = HypergraphDB()
+        db.store.add_node(Node("A", "table"))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db.save(tmpdir, format="json")
+            db.store.add_node(Node("B", "table", {"big": 2**70}))
+            with pytest.raises(OverflowError):
+                db.save(tmpdir, format="msgpack")
+            loaded = HypergraphDB.load(tmpdir)
+
+        assert loaded.store.get_node("A") is not None
+        assert loaded.store.get_node("B") is None
+
     def test_load_db_no_default_namespace(self):
         """Load DB without default namespace sets current to first available."""
         db = HypergraphDB()
@@ -8,6 +8,7 @@ These tests ensure our implementation can:
 """
 
 import json
+import sys
 
 import pytest
 
@@ -235,6 +236,27 @@ class TestHIFRoundtrip:
         restored = HypergraphStore.from_hif(parsed)
         assert restored.get_node("A") is not None
 
+    def test_hif_json_bytes_roundtrip(self):
+        """to_hif_json()/from_hif_json() round-trip through bytes and str."""
+        s = HypergraphStore()
+        s.add_node(Node("A", "test", {"label": "caf\u00e9"}))
+        s.add_node(Node("B", "test"))
+        s.add_edge(
+            Hyperedge(
+                id="e1",
+                type="test",
+                incidences=[Incidence("A", direction="tail"), Incidence("B", direction="head")],
+                source="schema",
+            )
+        )
+
+        data = s.to_hif_json()
+        assert isinstance(data, bytes)
+        for payload in (data, data.decode("utf-8")):
+            restored = HypergraphStore.from_hif_json(payload)
+            assert restored.get_node("A").properties == {"label": "caf\u00e9"}
+            assert restored.get_edge("e1") == s.get_edge("e1")
+
 
 class TestHIFImportFromExternal:
     """Tests for importing HIF from external sources."""
@@ -311,6 +333,20 @@ class TestHIFImportFromExternal:
         assert store.get_edge("0") is not None
         assert store.get_edge("1") is not None
 
+    def test_from_hif_interns_ids(self):
+        """Stringified integer IDs are shared between records and incidences."""
+        hif = {
+            "incidences": [{"node": n, "edge": 100 + n % 10} for n in range(1000, 2000)],
+        }
+        store = HypergraphStore.from_hif(hif)
+
+        assert len(store.get_all_edges()) == 10
+        first, second = store.get_edge("100").incidences[:2]
+        assert first.node_id is store.get_node("1000").id
+        assert second.node_id is store.get_node("1010").id
+        assert store.get_edge("100").id is sys.intern("".join(["10", "0"]))
+        assert store.get_edge("101").type is store.get_edge("102").type
+
 
 class TestHIFDirectionModes:
     """Tests for direction handling in HIF."""
@@ -390,6 +426,12 @@ class TestHIFDirectionModes:
         )
 
         hif = s.to_hif()
+        # Undirected incidences omit the direction key entirely
+        for inc in hif["incidences"]:
+            if inc["edge"] == "undirected":
+                assert "direction" not in inc
+            else:
+                assert inc["direction"] in ("head", "tail")
         restored = HypergraphStore.from_hif(hif)
 
         # Directed edge should preserve direction
@@ -500,6 +542,28 @@ class TestHIFEdgeCases:
         assert restored.get_node("schema::table") is not None
         assert restored.get_edge("edge/with/slashes") is not None
 
+    def test_special_characters_in_ids_json_bytes(self):
+        """to_hif_json()/from_hif_json() should handle special characters in IDs."""
+        s = HypergraphStore()
+        s.add_node(Node("table.column", "test"))
+        s.add_node(Node("schema::table", "test"))
+        s.add_edge(
+            Hyperedge(
+                id="edge/with/slashes",
+                type="test",
+                incidences=[
+                    Incidence("table.column"),
+                    Incidence("schema::table"),
+                ],
+            )
+        )
+
+        restored = HypergraphStore.from_hif_json(s.to_hif_json())
+
+        assert restored.get_node("table.column") is not None
+        assert restored.get_node("schema::table") is not None
+        assert restored.get_edge("edge/with/slashes") is not None
+
 
 class TestHIFValidation:
     """Tests for HIF import validation."""
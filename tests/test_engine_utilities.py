@@ -386,64 +386,49 @@ class TestMultipleEdgesSameNodeSet:
 class TestGetEdgesByNodeSetComprehensive:
     """Comprehensive tests for get_edges_by_node_set (plural) method."""
 
-    def test_empty_store_returns_empty_list(self):
-        """Empty store returns empty list."""
-        store = HypergraphStore()
-        edges = store.get_edges_by_node_set({"A", "B"})
-        assert edges == []
-
-    def test_no_matching_node_set_returns_empty(self):
-        """Non-matching node set returns empty list."""
-        store = HypergraphStore()
-        store.add_node(Node("A", "test"))
-        store.add_node(Node("B", "test"))
-        store.add_edge(Hyperedge("e1", "rel", [Incidence("A"), Incidence("B")]))
-        edges = store.get_edges_by_node_set({"X", "Y"})
-        assert edges == []
-
-    def test_single_edge_returns_list_of_one(self):
-        """Single matching edge returns list with one element."""
-        store = HypergraphStore()
-        store.add_node(Node("A", "test"))
-        store.add_node(Node("B", "test"))
-        store.add_edge(Hyperedge("e1", "rel", [Incidence("A"), Incidence("B")]))
-        edges = store.get_edges_by_node_set({"A", "B"})
-        assert len(edges) == 1
-        assert edges[0].id == "e1"
-
-    def test_type_filter_with_no_match(self):
-        """Type filter with no matching type returns empty."""
-        store = HypergraphStore()
-        store.add_node(Node("A", "test"))
-        store.add_node(Node("B", "test"))
-        store.add_edge(Hyperedge("e1", "rel", [Incidence("A"), Incidence("B")]))
-        edges = store.get_edges_by_node_set({"A", "B"}, edge_type="nonexistent")
-        assert edges == []
-
-    def test_type_filter_with_multiple_edges(self):
-        """Type filter correctly filters multiple edges."""
+    @pytest.mark.parametrize(
+        ("edges", "node_set", "edge_type", "expected"),
+        [
+            ([], {"A", "B"}, None, set()),
+            ([("e1", "rel", ["A", "B"])], {"X", "Y"}, None, set()),
+            ([("e1", "rel", ["A", "B"])], {"A", "B"}, None, {"e1"}),
+            ([("e1", "rel", ["A", "B"])], {"A", "B"}, "nonexistent", set()),
+            (
+                [("e1", "fk", ["A", "B"]), ("e2", "fk", ["A", "B"]), ("e3", "concept", ["A", "B"])],
+                {"A", "B"},
+                "fk",
+                {"e1", "e2"},
+            ),
+            (
+                [("e1", "fk", ["A", "B"]), ("e2", "fk", ["A", "B"]), ("e3", "concept", ["A", "B"])],
+                {"A", "B"},
+                "concept",
+                {"e3"},
+            ),
+            ([("e1", "rel", ["A"])], set(), None, set()),
+        ],
+        ids=[
+            "empty_store",
+            "no_matching_node_set",
+            "single_edge",
+            "type_filter_no_match",
+            "type_filter_multiple",
+            "type_filter_single",
+            "empty_node_set",
+        ],
+    )
+    def test_lookup(self, edges, node_set, edge_type, expected):
+        """Lookup returns exactly the edges over node_set, filtered by edge_type."""
         store = HypergraphStore()
-        store.add_node(Node("A", "test"))
-        store.add_node(Node("B", "test"))
-        store.add_edge(Hyperedge("e1", "fk", [Incidence("A"), Incidence("B")]))
-        store.add_edge(Hyperedge("e2", "fk", [Incidence("A"), Incidence("B")]))
-        store.add_edge(Hyperedge("e3", "concept", [Incidence("A"), Incidence("B")]))
-
-        fk_edges = store.get_edges_by_node_set({"A", "B"}, edge_type="fk")
-        assert len(fk_edges) == 2
-        assert {e.id for e in fk_edges} == {"e1", "e2"}
+        for node_id in sorted({n for _, _, members in edges for n in members}):
+            store.add_node(Node(node_id, "test"))
+        for edge_id, etype, members in edges:
+            store.add_edge(Hyperedge(edge_id, etype, [Incidence(n) for n in members]))
 
-        concept_edges = store.get_edges_by_node_set({"A", "B"}, edge_type="concept")
-        assert len(concept_edges) == 1
-        assert concept_edges[0].id == "e3"
-
-    def test_empty_node_set_returns_empty(self):
-        """Empty node set returns empty list."""
-        store = HypergraphStore()
-        store.add_node(Node("A", "test"))
-        store.add_edge(Hyperedge("e1", "rel", [Incidence("A")]))
-        edges = store.get_edges_by_node_set(set())
-        assert edges == []
+        result = store.get_edges_by_node_set(node_set, edge_type=edge_type)
+        assert isinstance(result, list)
+        assert len(result) == len(expected)
+        assert {e.id for e in result} == expected
 
     def test_returns_hyperedge_objects(self):
         """Returned items are Hyperedge instances with full properties."""
@@ -759,12 +744,17 @@ class TestLargeDataHandling:
         assert node is not None
         assert len(node.properties["large"]) == 1024 * 1024
 
+        # The dict form shares the string; only the JSON form actually moves it
+        restored = HypergraphStore.from_dict_json(store.to_dict_json())
+        assert restored.get_node("A").properties["large"] == large_value
+
     def test_deeply_nested_properties(self):
-        """Handle deeply nested properties (50 levels) in roundtrip."""
+        """Handle deeply nested properties (500 levels) in roundtrip."""
         store = HypergraphStore()
-        # Build 50-level nested structure (not 100 to keep reasonable)
+        # to_dict/from_dict pass property values through without walking them,
+        # so depth is not bounded by the recursion limit here.
         nested: dict = {"value": "deep"}
-        for _ in range(50):
+        for _ in range(500):
             nested = {"nested": nested}
 
         store.add_node(Node("A", "test", nested))
@@ -778,7 +768,7 @@ class TestLargeDataHandling:
 
         # Verify deep nesting preserved
         current = node.properties
-        for _ in range(50):
+        for _ in range(500):
             assert "nested" in current
             current = current["nested"]
         assert current["value"] == "deep"